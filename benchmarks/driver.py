@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""In-process benchmark driver; run.py starts it inside a headless display.
+
+Imports main.py, runs ``BigLinuxWelcomeApp`` and walks the window through
+every page with ``_on_next`` and back with ``_on_back``, waiting for the
+frame clock to paint after each step. Then it lets the welcome page logo
+animate for a while. Results are printed to stdout as ``BENCH {json}``
+lines, one per event:
+
+* ``first_frame``: milliseconds from the start of this script,
+* ``nav``: direction, target page and milliseconds until the next frame,
+* ``logo``: ``AnimatedLogo.frame_cost()`` over the idle period,
+* ``done``: peak RSS and the page build phases recorded by the profiler.
+"""
+
+import time
+
+START = time.perf_counter()
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import resource  # noqa: E402
+import sys  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIR = os.path.join(ROOT, "usr", "share", "biglinux", "welcome")
+PREFIX = "BENCH "
+
+
+def emit(event: str, **data) -> None:
+    print(PREFIX + json.dumps({"event": event, **data}), flush=True)
+
+
+def elapsed_ms(since: float) -> float:
+    return round((time.perf_counter() - since) * 1000, 3)
+
+
+class Driver:
+    """Steps through the window from after-paint callbacks."""
+
+    def __init__(self, app, args: argparse.Namespace) -> None:
+        from gi.repository import GLib
+
+        self.GLib = GLib
+        self.app = app
+        self.args = args
+        self.win = None
+        self.clock = None
+        self._steps = None
+        # (event data, start time) of the step waiting for its frame
+        self._pending: tuple[dict, float] | None = ({"event": "first_frame"}, START)
+        app.connect("window-added", self._on_window_added)
+        GLib.timeout_add_seconds(args.timeout, self._on_timeout)
+
+    def _on_window_added(self, _app, win) -> None:
+        if self.win is not None:
+            return
+        self.win = win
+        if self.args.cold:
+            # Every step then includes building the page it shows
+            win._schedule_prefetch = lambda: None
+        win.connect("realize", self._on_realize)
+
+    def _on_realize(self, win) -> None:
+        self.clock = win.get_frame_clock()
+        self.clock.connect("after-paint", self._on_paint)
+
+    def _on_paint(self, _clock) -> None:
+        if self._pending is None:
+            return
+        data, started = self._pending
+        self._pending = None
+        event = data.pop("event")
+        emit(event, ms=elapsed_ms(started), **data)
+        if event == "first_frame":
+            self._steps = self._navigation()
+        self.GLib.timeout_add(self.args.settle_ms, self._step)
+
+    def _navigation(self):
+        win = self.win
+        last = len(win.page_widgets) - 1
+        for _ in range(last):
+            yield "next", win._on_next
+        for _ in range(last):
+            yield "back", win._on_back
+
+    def _step(self) -> bool:
+        step = next(self._steps, None)
+        if step is None:
+            self._measure_logo()
+            return self.GLib.SOURCE_REMOVE
+        direction, handler = step
+        started = time.perf_counter()
+        handler(None)
+        self._pending = ({"event": "nav", "direction": direction, "page": self.win.current_page}, started)
+        return self.GLib.SOURCE_REMOVE
+
+    def _measure_logo(self) -> None:
+        logo = getattr(self.win, "logo_animation", None)
+        if logo is None or self.args.logo_seconds <= 0:
+            self._finish()
+            return
+        # Only count frames drawn while idling on the welcome page
+        logo.draw_count = 0
+        logo.draw_total_ms = 0.0
+        logo.draw_max_ms = 0.0
+
+        def on_done() -> bool:
+            emit("logo", seconds=self.args.logo_seconds, **logo.frame_cost())
+            self._finish()
+            return self.GLib.SOURCE_REMOVE
+
+        self.GLib.timeout_add(int(self.args.logo_seconds * 1000), on_done)
+
+    def _finish(self) -> None:
+        import main
+
+        builds = [
+            {"name": phase["name"], "wall_ms": phase.get("wall_ms", 0.0)}
+            for phase in main.PROFILER.phases
+            if phase["name"].startswith("build_")
+        ]
+        pages = self.win.pages_data or []
+        emit(
+            "done",
+            # ru_maxrss is in KiB on Linux
+            peak_rss_kib=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            pages=len(pages),
+            actions=sum(len(page.get("actions", [])) for page in pages),
+            builds=builds,
+        )
+        self.app.quit()
+
+    def _on_timeout(self) -> bool:
+        emit("error", message=f"timed out after {self.args.timeout} s")
+        self.app.quit()
+        return self.GLib.SOURCE_REMOVE
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--settle-ms", type=int, default=300, help="pause between steps (default 300)")
+    parser.add_argument("--logo-seconds", type=float, default=3.0, help="logo measuring time (default 3)")
+    parser.add_argument("--cold", action="store_true", help="disable page prefetching")
+    parser.add_argument("--timeout", type=int, default=300, help="give up after this many seconds")
+    args = parser.parse_args()
+
+    # main.py reads its own options from argv when imported
+    sys.argv = [os.path.join(APP_DIR, "main.py")]
+    sys.path.insert(0, APP_DIR)
+    import main as welcome
+
+    from gi.repository import Gio
+
+    welcome.setup_locale()
+    app = welcome.BigLinuxWelcomeApp()
+    # Never hand the run over to an instance that is already open
+    app.set_flags(app.get_flags() | Gio.ApplicationFlags.NON_UNIQUE)
+    Driver(app, args)
+    return app.run(sys.argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
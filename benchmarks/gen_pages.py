@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Generate synthetic pages.yaml catalogs for the benchmarks.
+
+The catalog has ``--pages`` action pages with ``--actions`` cards each. The
+cards reuse the icons shipped in image/, so decoding costs are realistic,
+and start ``true`` so every card counts as available. With ``--browsers``
+the browser page of the real pages.yaml is inserted as the second page.
+
+Usage: python3 gen_pages.py --pages 24 --actions 40 [--browsers] [-o FILE]
+Without ``-o`` the YAML is written to stdout.
+"""
+
+import argparse
+import os
+import sys
+
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIR = os.path.join(ROOT, "usr", "share", "biglinux", "welcome")
+PAGE_ICONS = (
+    "video-display-symbolic",
+    "applications-system-symbolic",
+    "preferences-system-symbolic",
+    "emblem-favorite-symbolic",
+)
+
+
+def bundled_icons() -> list[str]:
+    """Action icons from image/, relative to it, as pages.yaml names them."""
+    icons = []
+    image_dir = os.path.join(APP_DIR, "image")
+    for root, dirs, files in os.walk(image_dir):
+        dirs.sort()
+        if os.path.basename(root) == "browsers":
+            continue
+        for name in sorted(files):
+            if name.endswith((".svg", ".png")) and "qrcode" not in name.lower():
+                icons.append(os.path.relpath(os.path.join(root, name), image_dir))
+    return icons
+
+
+def browser_page() -> dict | None:
+    with open(os.path.join(APP_DIR, "pages.yaml"), encoding="utf-8") as f:
+        pages = yaml.safe_load(f) or []
+    return next((page for page in pages if page.get("page_type") == "browsers"), None)
+
+
+def generate(pages: int, actions: int, browsers: bool = False) -> list[dict]:
+    """Return the page list of a catalog with ``pages`` x ``actions`` cards."""
+    icons = bundled_icons() or ["image-missing"]
+    catalog = []
+    for p in range(pages):
+        catalog.append({
+            "title": f"Synthetic page {p + 1}",
+            "subtitle": f"{actions} generated actions.",
+            "icon": PAGE_ICONS[p % len(PAGE_ICONS)],
+            "actions": [
+                {
+                    "label": f"Action {p + 1}.{a + 1}",
+                    "icon": icons[(p * actions + a) % len(icons)],
+                    "type": "app",
+                    "command": "true",
+                }
+                for a in range(actions)
+            ],
+        })
+    if browsers:
+        page = browser_page()
+        if page:
+            catalog.insert(min(1, len(catalog)), page)
+    return catalog
+
+
+def write(path: str, pages: int, actions: int, browsers: bool = False) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(generate(pages, actions, browsers), f, sort_keys=False)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=12, help="action pages (default 12)")
+    parser.add_argument("--actions", type=int, default=24, help="actions per page (default 24)")
+    parser.add_argument("--browsers", action="store_true", help="include the real browser page")
+    parser.add_argument("-o", "--output", help="output file (default stdout)")
+    args = parser.parse_args()
+
+    if args.output:
+        write(args.output, args.pages, args.actions, args.browsers)
+    else:
+        yaml.safe_dump(generate(args.pages, args.actions, args.browsers), sys.stdout, sort_keys=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
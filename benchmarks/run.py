@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Headless benchmarks for BigLinux Welcome.
+
+Runs the window under a private display with driver.py. Each run gets empty
+config and state directories and its own runtime directory, so it never
+talks to a running session. It measures:
+
+* time to first frame, from spawning Python and from inside the process,
+* the latency of every ``_on_next`` / ``_on_back`` step until the next frame,
+* ``AnimatedLogo`` draw cost while the welcome page idles,
+* peak RSS,
+* the build time of every page, to see how it grows with the catalog size.
+
+Catalogs are the real pages.yaml and synthetic ones from gen_pages.py,
+given as PAGESxACTIONS. The first run of each catalog only warms the
+caches unless ``--cold-cache`` is given.
+
+Displays: ``broadway`` starts gtk4-broadwayd; ``weston`` starts a headless
+weston; ``current`` uses the display of the calling environment. With
+``--offline`` the app runs in a new network namespace (``unshare``).
+
+Usage: python3 run.py [--catalog 12x25 ...] [--runs N] [--display broadway]
+                      [--cold] [--cold-cache] [--offline] [--json FILE]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+import gen_pages  # noqa: E402
+
+DRIVER = os.path.join(HERE, "driver.py")
+DEFAULT_CATALOGS = ["upstream", "12x25", "24x50", "36x100"]
+DISPLAY_NUMBER = 57
+
+
+class Display:
+    """A private display server and the environment that selects it."""
+
+    def __init__(self, kind: str, runtime_dir: str) -> None:
+        self.kind = kind
+        self.runtime_dir = runtime_dir
+        self.env: dict[str, str] = {}
+        self.process: subprocess.Popen | None = None
+
+    def start(self) -> None:
+        if self.kind == "current":
+            return
+        env = dict(os.environ, XDG_RUNTIME_DIR=self.runtime_dir)
+        if self.kind == "broadway":
+            server = shutil.which("gtk4-broadwayd") or shutil.which("broadwayd")
+            if not server:
+                sys.exit("gtk4-broadwayd was not found; install gtk4 or use --display weston")
+            display = f":{DISPLAY_NUMBER}"
+            argv = [server, display]
+            socket = os.path.join(self.runtime_dir, f"broadway{DISPLAY_NUMBER + 1}.socket")
+            self.env = {"GDK_BACKEND": "broadway", "BROADWAY_DISPLAY": display, "XDG_RUNTIME_DIR": self.runtime_dir}
+        elif self.kind == "weston":
+            server = shutil.which("weston")
+            if not server:
+                sys.exit("weston was not found; use --display broadway")
+            name = "wayland-welcome-bench"
+            argv = [server, "--backend=headless", f"--socket={name}", "--idle-time=0"]
+            socket = os.path.join(self.runtime_dir, name)
+            self.env = {"GDK_BACKEND": "wayland", "WAYLAND_DISPLAY": name, "XDG_RUNTIME_DIR": self.runtime_dir}
+        else:
+            sys.exit(f"Unknown display {self.kind!r}")
+
+        self.process = subprocess.Popen(argv, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + 10
+        while not os.path.exists(socket):
+            if self.process.poll() is not None or time.monotonic() > deadline:
+                self.stop()
+                sys.exit(f"{os.path.basename(server)} did not start")
+            time.sleep(0.05)
+
+    def stop(self) -> None:
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
+
+
+def parse_catalog(spec: str) -> tuple[int, int] | None:
+    """Return (pages, actions) for PAGESxACTIONS; None for "upstream"."""
+    if spec == "upstream":
+        return None
+    try:
+        pages, actions = (int(n) for n in spec.lower().split("x"))
+    except ValueError:
+        sys.exit(f"Invalid catalog {spec!r}; expected upstream or PAGESxACTIONS")
+    return pages, actions
+
+
+def run_once(args: argparse.Namespace, env: dict[str, str]) -> dict:
+    """Run the driver once and collect its events."""
+    argv = [
+        sys.executable,
+        DRIVER,
+        f"--settle-ms={args.settle_ms}",
+        f"--logo-seconds={args.logo_seconds}",
+        f"--timeout={args.timeout}",
+    ]
+    if args.cold:
+        argv.append("--cold")
+    if args.offline:
+        argv = ["unshare", "--user", "--map-current-user", "--net", *argv]
+
+    run = {"nav": [], "errors": []}
+    spawned = time.perf_counter()
+    child = subprocess.Popen(
+        argv, env=env, stdout=subprocess.PIPE, stderr=None if args.verbose else subprocess.DEVNULL, text=True
+    )
+    for line in child.stdout:
+        if not line.startswith("BENCH "):
+            if args.verbose:
+                print(line, end="", file=sys.stderr)
+            continue
+        data = json.loads(line[len("BENCH ") :])
+        event = data.pop("event")
+        if event == "first_frame":
+            run["ttff_ms"] = round((time.perf_counter() - spawned) * 1000, 3)
+            run["first_frame_ms"] = data["ms"]
+        elif event == "nav":
+            run["nav"].append(data)
+        elif event == "error":
+            run["errors"].append(data["message"])
+        else:
+            run[event] = data
+    child.wait()
+    if child.returncode != 0 and "done" not in run:
+        run["errors"].append(f"driver exited with status {child.returncode}")
+    return run
+
+
+def summarize(runs: list[dict]) -> dict:
+    """Medians over the runs of every measured value."""
+
+    def median(values: list[float]) -> float:
+        return round(statistics.median(values), 3) if values else 0.0
+
+    runs = [run for run in runs if "done" in run]
+    if not runs:
+        return {}
+    summary = {
+        "runs": len(runs),
+        "pages": runs[0]["done"]["pages"],
+        "actions": runs[0]["done"]["actions"],
+        "ttff_ms": median([run["ttff_ms"] for run in runs]),
+        "first_frame_ms": median([run["first_frame_ms"] for run in runs]),
+        "peak_rss_mib": median([run["done"]["peak_rss_kib"] / 1024 for run in runs]),
+    }
+    for direction in ("next", "back"):
+        latencies = [step["ms"] for run in runs for step in run["nav"] if step["direction"] == direction]
+        summary[f"{direction}_median_ms"] = median(latencies)
+        summary[f"{direction}_max_ms"] = max(latencies, default=0.0)
+    logos = [run["logo"] for run in runs if run.get("logo", {}).get("frames")]
+    summary["logo_frames"] = median([logo["frames"] for logo in logos])
+    summary["logo_mean_ms"] = median([logo["mean_ms"] for logo in logos])
+    summary["logo_max_ms"] = max((logo["max_ms"] for logo in logos), default=0.0)
+
+    # Build time per page, matched by phase name across runs
+    builds: dict[str, list[float]] = {}
+    for run in runs:
+        for build in run["done"]["builds"]:
+            builds.setdefault(build["name"], []).append(build["wall_ms"])
+    action_builds = [median(v) for name, v in builds.items() if name.startswith("build_action_page")]
+    summary["action_page_build_median_ms"] = median(action_builds)
+    summary["action_page_build_total_ms"] = round(sum(action_builds), 3)
+    summary["builds_ms"] = {name: median(values) for name, values in builds.items()}
+    return summary
+
+
+def print_table(results: dict[str, dict]) -> None:
+    columns = [
+        ("catalog", None),
+        ("pages", "pages"),
+        ("actions", "actions"),
+        ("ttff ms", "ttff_ms"),
+        ("next ms", "next_median_ms"),
+        ("next max", "next_max_ms"),
+        ("back ms", "back_median_ms"),
+        ("page build", "action_page_build_median_ms"),
+        ("logo ms", "logo_mean_ms"),
+        ("rss MiB", "peak_rss_mib"),
+    ]
+    print("  ".join(f"{title:>10}" for title, _key in columns))
+    for catalog, summary in results.items():
+        cells = [f"{catalog:>10}"]
+        for _title, key in columns[1:]:
+            value = summary.get(key, "-")
+            cells.append(f"{value:>10.1f}" if isinstance(value, float) else f"{value:>10}")
+        print("  ".join(cells))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--catalog", action="append", help="upstream or PAGESxACTIONS; repeatable (default: "
+        + ", ".join(DEFAULT_CATALOGS) + ")"
+    )
+    parser.add_argument("--browsers", action="store_true", help="add the browser page to synthetic catalogs")
+    parser.add_argument("--runs", type=int, default=3, help="measured runs per catalog (default 3)")
+    parser.add_argument("--display", default="broadway", choices=("broadway", "weston", "current"))
+    parser.add_argument("--settle-ms", type=int, default=300, help="pause between steps (default 300)")
+    parser.add_argument("--logo-seconds", type=float, default=3.0, help="logo measuring time (default 3)")
+    parser.add_argument("--cold", action="store_true", help="disable page prefetching")
+    parser.add_argument("--cold-cache", action="store_true", help="empty the caches before every run")
+    parser.add_argument("--offline", action="store_true", help="run without network access")
+    parser.add_argument("--timeout", type=int, default=300, help="seconds before a run is abandoned")
+    parser.add_argument("--json", help="write the raw runs and summaries to this file")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show the application output")
+    args = parser.parse_args()
+
+    catalogs = args.catalog or DEFAULT_CATALOGS
+    results: dict[str, dict] = {}
+    raw: dict[str, list[dict]] = {}
+    with tempfile.TemporaryDirectory(prefix="welcome-bench-") as tmp:
+        runtime_dir = os.path.join(tmp, "runtime")
+        os.makedirs(runtime_dir, mode=0o700)
+        display = Display(args.display, runtime_dir)
+        display.start()
+        try:
+            for catalog in catalogs:
+                size = parse_catalog(catalog)
+                env = dict(os.environ, **display.env)
+                env["BIGLINUX_WELCOME_PROFILE"] = os.path.join(tmp, "profile.json")
+                env.pop("DBUS_SESSION_BUS_ADDRESS", None)
+                env.pop("BIGLINUX_WELCOME_PAGES", None)
+                if size:
+                    pages_file = os.path.join(tmp, f"pages-{catalog}.yaml")
+                    gen_pages.write(pages_file, *size, browsers=args.browsers)
+                    env["BIGLINUX_WELCOME_PAGES"] = pages_file
+
+                runs = []
+                for i in range(args.runs + (0 if args.cold_cache else 1)):
+                    home = os.path.join(tmp, "home", catalog if not args.cold_cache else f"{catalog}-{i}")
+                    env["XDG_CONFIG_HOME"] = os.path.join(home, "config")
+                    env["XDG_CACHE_HOME"] = os.path.join(home, "cache")
+                    # Every run starts without the state of the previous one
+                    shutil.rmtree(env["XDG_CONFIG_HOME"], ignore_errors=True)
+                    run = run_once(args, env)
+                    for error in run["errors"]:
+                        print(f"Error in {catalog} run {i + 1}: {error}", file=sys.stderr)
+                    if args.cold_cache or i > 0:
+                        runs.append(run)
+                raw[catalog] = runs
+                results[catalog] = summarize(runs)
+        finally:
+            display.stop()
+
+    print_table(results)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"summary": results, "runs": raw}, f, indent=2)
+        print(f"\nResults written to {args.json}")
+    return 0 if all(results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Compile the BigLinux Welcome assets into a GResource bundle.
+
+Writes biglinux-welcome.gresource.xml listing style.css, pages.yaml and
+every file under image/, and runs glib-compile-resources on it. The bundle
+is placed next to main.py, where resources.py looks for it. The PKGBUILD
+then removes the plain files; a checkout keeps them and resources.py uses
+them unless BIGLINUX_WELCOME_NO_GRESOURCE=0 is set.
+
+Usage: python3 build_resources.py [APP_DIR]
+APP_DIR defaults to usr/share/biglinux/welcome in this checkout.
+"""
+
+import os
+import subprocess
+import sys
+from xml.sax.saxutils import escape
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_APP_DIR = os.path.join(ROOT, "usr", "share", "biglinux", "welcome")
+PREFIX = "/org/biglinux/welcome"
+BUNDLE = "biglinux-welcome.gresource"
+TEXT_FILES = ("style.css", "pages.yaml")
+
+
+def asset_files(app_dir: str) -> list[tuple[str, bool]]:
+    """Return (path relative to app_dir, compress) for every bundled asset."""
+    files = [(name, True) for name in TEXT_FILES if os.path.isfile(os.path.join(app_dir, name))]
+    for root, dirs, names in os.walk(os.path.join(app_dir, "image")):
+        dirs.sort()
+        for name in sorted(names):
+            path = os.path.relpath(os.path.join(root, name), app_dir)
+            # PNGs are compressed already
+            files.append((path, not name.endswith(".png")))
+    return files
+
+
+def write_xml(app_dir: str) -> str:
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', "<gresources>", f'  <gresource prefix="{PREFIX}">']
+    for path, compress in asset_files(app_dir):
+        attrs = ' compressed="true"' if compress else ""
+        lines.append(f"    <file{attrs}>{escape(path)}</file>")
+    lines += ["  </gresource>", "</gresources>", ""]
+
+    xml = os.path.join(app_dir, BUNDLE + ".xml")
+    with open(xml, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    return xml
+
+
+def main() -> int:
+    app_dir = os.path.abspath(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_APP_DIR)
+    xml = write_xml(app_dir)
+    target = os.path.join(app_dir, BUNDLE)
+    try:
+        subprocess.run(
+            ["glib-compile-resources", f"--sourcedir={app_dir}", f"--target={target}", xml],
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Error compiling resources: {e}")
+        return 1
+    finally:
+        os.unlink(xml)
+    print(f"Wrote {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Import-time report and budget check for BigLinux Welcome.
+
+Imports main.py (without running it, so no window opens) in fresh
+interpreters under ``python -X importtime``, prints the most expensive
+modules and compares the result with import-budget.json:
+
+* ``total_ms``: median total import time over the measured runs,
+* ``forbidden``: modules that must not be loaded at startup because only
+  some pages or clicks need them.
+
+Usage: python3 import_budget.py [--runs N] [--top N] [--budget FILE]
+The exit status is 1 when the budget is exceeded.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.join(ROOT, "usr", "share", "biglinux", "welcome")
+DEFAULT_BUDGET = os.path.join(ROOT, "import-budget.json")
+
+
+def measure() -> dict[str, tuple[int, int]]:
+    """Import main.py once; returns {module: (self_us, cumulative_us)}."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="")
+    env.pop("BIGLINUX_WELCOME_PROFILE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=APP_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.exit(f"Importing main.py failed:\n{result.stderr}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].strip()
+        modules[name] = (int(fields[0]), int(fields[1]))
+    return modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="measured runs (default 5)")
+    parser.add_argument("--top", type=int, default=20, help="modules to list (default 20)")
+    parser.add_argument("--budget", default=DEFAULT_BUDGET, help="budget file")
+    args = parser.parse_args()
+
+    with open(args.budget, encoding="utf-8") as f:
+        budget = json.load(f)
+
+    # The first run compiles bytecode; it is not counted
+    measure()
+    runs = [measure() for _ in range(max(args.runs, 1))]
+    totals = [sum(self_us for self_us, _cumulative in run.values()) / 1000 for run in runs]
+    total_ms = statistics.median(totals)
+
+    last = runs[-1]
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for name, (self_us, cumulative_us) in sorted(last.items(), key=lambda item: -item[1][1])[: args.top]:
+        print(f"{self_us / 1000:9.2f} {cumulative_us / 1000:9.2f}  {name}")
+    print(f"\nTotal import time: {total_ms:.1f} ms (median of {len(runs)}), budget {budget['total_ms']} ms")
+
+    failed = False
+    if total_ms > budget["total_ms"]:
+        print(f"FAIL: import time exceeds the budget by {total_ms - budget['total_ms']:.1f} ms")
+        failed = True
+    loaded = sorted(name for name in budget.get("forbidden", []) if name in last)
+    if loaded:
+        print(f"FAIL: imported at startup: {', '.join(loaded)}")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
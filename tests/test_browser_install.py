@@ -0,0 +1,41 @@
+"""Tests for the progress parsing of scripts/browserInstall.py."""
+
+import importlib.util
+import os
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "usr", "share", "biglinux", "welcome", "scripts", "browserInstall.py")
+
+
+def load_script():
+    spec = importlib.util.spec_from_file_location("browserInstall", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+browser_install = load_script()
+
+
+class InstallLineTest(unittest.TestCase):
+    def match(self, line: str) -> tuple | None:
+        match = browser_install.INSTALL_LINE.search(line)
+        return match.groups() if match else None
+
+    def test_counter(self) -> None:
+        self.assertEqual(self.match("(1/3) installing firefox"), ("1", "3", "firefox"))
+
+    def test_padded_counter(self) -> None:
+        self.assertEqual(self.match("( 1/12) installing firefox"), ("1", "12", "firefox"))
+        self.assertEqual(self.match("(  7/120) upgrading lib32-glibc"), ("7", "120", "lib32-glibc"))
+
+    def test_without_counter(self) -> None:
+        self.assertEqual(self.match("installing brave-bin..."), (None, None, "brave-bin"))
+
+    def test_other_output(self) -> None:
+        self.assertIsNone(self.match(":: Processing package changes..."))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""Tests for the version ordering of pacman_db.py."""
+
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "usr", "share", "biglinux", "welcome"))
+
+from pacman_db import vercmp  # noqa: E402
+
+
+class VercmpTest(unittest.TestCase):
+    def check(self, older: str, newer: str) -> None:
+        self.assertEqual(vercmp(older, newer), -1)
+        self.assertEqual(vercmp(newer, older), 1)
+
+    def test_equal(self) -> None:
+        for a, b in [("1.0", "1.0"), ("1.01", "1.1"), ("0:1.0", "1.0"), ("1.0-1", "1.0"), ("1_0", "1.0")]:
+            self.assertEqual(vercmp(a, b), 0, (a, b))
+
+    def test_numeric_segments(self) -> None:
+        self.check("1.9", "1.10")
+        self.check("1.0", "1.0.1")
+        self.check("2.0-1", "2.0.0-1")
+
+    def test_letters(self) -> None:
+        self.check("1.0alpha", "1.0")
+        self.check("1.0a", "1.0b")
+        self.check("1.a", "1.1")
+
+    def test_epoch_and_release(self) -> None:
+        self.check("2.0", "1:1.0")
+        self.check("1.0-1", "1.0-2")
+        self.check("1.0-9", "1.0-10")
+
+
+if __name__ == "__main__":
+    unittest.main()
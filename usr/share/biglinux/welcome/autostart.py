@@ -0,0 +1,221 @@
+"""Login-time check run before anything heavy is imported.
+
+The autostart entry starts ``biglinux-welcome --autostart``. The entry
+module welcome.py hands that flag to ``handle`` before main.py and GTK are
+imported, and the process exits right away when the user turned "Show on
+startup" off or completed the tour, as recorded in the state file that
+state.StateStore writes, or when the user's autostart entry has
+``Hidden=true`` (which not every session honours). Only the standard
+library is used here.
+
+When the window is to be shown, it first waits for the login rush to settle:
+the CPU and IO stall averages in /proc/pressure (or the load average on
+kernels without PSI) are polled with a plain sleep until they drop under a
+threshold or a maximum delay passes. Both limits can be set with
+``--autostart-threshold=PERCENT`` / ``--autostart-max-delay=SECONDS`` or the
+matching environment variables, and the time spent waiting is recorded.
+
+User copies of the autostart entry made before the flag existed get it
+added; until then a session manager's ``DESKTOP_AUTOSTART_ID`` also marks
+a login start.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+from xdg import cache_home, config_home
+
+FLAG = "--autostart"
+THRESHOLD_FLAG = "--autostart-threshold"
+MAX_DELAY_FLAG = "--autostart-max-delay"
+THRESHOLD_ENV = "BIGLINUX_WELCOME_AUTOSTART_THRESHOLD"
+MAX_DELAY_ENV = "BIGLINUX_WELCOME_AUTOSTART_MAX_DELAY"
+DESKTOP_ID = "org.biglinux.welcome.desktop"
+SESSION_AUTOSTART_ENV = "DESKTOP_AUTOSTART_ID"
+
+# Percent of the last 10 s some task stalled on CPU or IO
+DEFAULT_THRESHOLD = 10.0
+DEFAULT_MAX_DELAY = 30.0
+POLL_INTERVAL = 1.0
+# The load average fallback is compared in percent per CPU; a run queue is a
+# coarser signal than stall time, so it gets a proportionally higher limit
+LOADAVG_SCALE = 5.0
+
+# Seconds the last handle() waited before letting the window build
+deferred_seconds = 0.0
+
+
+def autostart_file() -> str:
+    return os.path.join(config_home(), "autostart", DESKTOP_ID)
+
+
+def state_file() -> str:
+    return os.path.join(config_home(), "biglinux-welcome", "state.ini")
+
+
+def is_hidden() -> bool:
+    """Whether the user's autostart entry disables the welcome window."""
+    try:
+        with open(autostart_file(), encoding="utf-8", errors="replace") as f:
+            for line in f:
+                key, _, value = line.partition("=")
+                key, value = key.strip(), value.strip().lower()
+                if key == "Hidden" and value == "true":
+                    return True
+                if key == "X-GNOME-Autostart-enabled" and value == "false":
+                    return True
+    except OSError:
+        pass
+    return False
+
+
+def _read_state():
+    """Return a ConfigParser of the state file; empty when it is unreadable."""
+    import configparser
+
+    state = configparser.ConfigParser(interpolation=None)
+    try:
+        state.read(state_file(), encoding="utf-8")
+    except configparser.Error as e:
+        # Duplicate keys are fine for GLib.KeyFile but not here; a partly
+        # read parser may hold lists instead of strings, so start over
+        print(f"Error reading {state_file()}: {e}")
+        return configparser.ConfigParser(interpolation=None)
+    return state
+
+
+def should_show() -> bool:
+    """Whether the window should open at login; unreadable state shows it."""
+    import configparser
+
+    if is_hidden():
+        return False
+    state = _read_state()
+    try:
+        enabled = state.getboolean("autostart", "enabled", fallback=True)
+        completed = state.getboolean("setup", "completed", fallback=False)
+    except (configparser.Error, AttributeError, ValueError):
+        return True
+    return enabled and not completed
+
+
+def migrate_user_entry() -> None:
+    """Add the autostart flag to a user copy of the entry that lacks it."""
+    path = autostart_file()
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()
+    except (OSError, UnicodeDecodeError):
+        return
+
+    changed = False
+    for i, line in enumerate(lines):
+        key, sep, value = line.partition("=")
+        value = value.strip()
+        if key.strip() == "Exec" and sep and "biglinux-welcome" in value and FLAG not in value.split():
+            lines[i] = f"Exec={value} {FLAG}\n"
+            changed = True
+    if not changed:
+        return
+    try:
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"Error updating {path}: {e}")
+
+
+def read_pressure(resource: str) -> float | None:
+    """Return the "some avg10" stall percentage of ``resource``, if available."""
+    try:
+        with open(f"/proc/pressure/{resource}", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("some "):
+                    for field in line.split()[1:]:
+                        key, _, value = field.partition("=")
+                        if key == "avg10":
+                            return float(value)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def session_load(threshold: float) -> tuple[float, float]:
+    """Return the current load and the limit it is compared with."""
+    pressures = [p for p in (read_pressure("cpu"), read_pressure("io")) if p is not None]
+    if pressures:
+        return max(pressures), threshold
+    try:
+        load = os.getloadavg()[0] / (os.cpu_count() or 1) * 100
+    except OSError:
+        return 0.0, threshold
+    return load, threshold * LOADAVG_SCALE
+
+
+def _take_option(argv: list[str], flag: str, env: str, default: float) -> float:
+    """Remove ``flag=VALUE`` from argv; fall back to ``env`` and ``default``."""
+    value = os.environ.get(env)
+    for i, arg in enumerate(argv[1:], start=1):
+        if arg.startswith(flag + "="):
+            del argv[i]
+            value = arg.split("=", 1)[1]
+            break
+    try:
+        return float(value) if value else default
+    except ValueError:
+        print(f"Error: invalid value {value!r} for {flag}")
+        return default
+
+
+def wait_for_quiet_session(threshold: float, max_delay: float) -> float:
+    """Sleep until the session load drops under ``threshold``; returns the wait."""
+    start = time.monotonic()
+    while True:
+        load, limit = session_load(threshold)
+        waited = time.monotonic() - start
+        if load < limit or waited >= max_delay:
+            return waited
+        time.sleep(min(POLL_INTERVAL, max_delay - waited))
+
+
+def _record_deferral(seconds: float, threshold: float, max_delay: float) -> None:
+    import json
+
+    path = os.path.join(cache_home(), "biglinux-welcome", "autostart-deferral.json")
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "time": time.time(),
+                    "deferred_s": round(seconds, 3),
+                    "threshold": threshold,
+                    "max_delay_s": max_delay,
+                },
+                f,
+            )
+    except OSError as e:
+        print(f"Error recording autostart deferral: {e}")
+
+
+def handle(argv: list[str]) -> None:
+    """Strip the autostart options from argv; exit or wait as they require."""
+    global deferred_seconds
+
+    threshold = _take_option(argv, THRESHOLD_FLAG, THRESHOLD_ENV, DEFAULT_THRESHOLD)
+    max_delay = _take_option(argv, MAX_DELAY_FLAG, MAX_DELAY_ENV, DEFAULT_MAX_DELAY)
+    if FLAG not in argv[1:]:
+        migrate_user_entry()
+        # An old user entry still started us without the flag
+        if not os.environ.get(SESSION_AUTOSTART_ENV):
+            return
+    argv[1:] = [arg for arg in argv[1:] if arg != FLAG]
+    if not should_show():
+        sys.exit(0)
+
+    deferred_seconds = wait_for_quiet_session(threshold, max_delay)
+    _record_deferral(deferred_seconds, threshold, max_delay)
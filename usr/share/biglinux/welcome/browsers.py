@@ -0,0 +1,204 @@
+"""Browser installation detection and monitoring.
+
+Every variant of every browser in pages.yaml is resolved in one pass. Each
+directory that holds a ``check`` path or ``.desktop`` files is listed at
+most once, through the shared ``CommandIndex`` listings, and the listing is
+reused until the directory's mtime changes.
+A variant counts as installed when its ``check`` path exists (system or
+per-user Flatpak) and its ``.desktop`` file is present in the XDG data
+dirs, which is what the desktop needs to launch it.
+
+``BrowserMonitor`` keeps the snapshot current while the window is open. It
+watches the directories involved with ``Gio.FileMonitor``, ignores entries
+no browser cares about, and reports the affected packages after a short
+debounce.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from typing import NamedTuple
+
+from gi.repository import Gio, GLib
+
+from commands import COMMANDS, CommandIndex
+from xdg import application_dirs, data_home, mimeapps_dirs
+
+SYSTEM_FLATPAK_APPS = "/var/lib/flatpak/app"
+
+
+def user_flatpak_apps() -> str:
+    return os.path.join(data_home(), "flatpak", "app")
+
+
+class BrowserState(NamedTuple):
+    """Resolved state of one browser."""
+
+    installed: bool
+    variant: dict | None
+    desktop: str | None
+
+
+NOT_INSTALLED = BrowserState(False, None, None)
+
+
+class BrowserDetector:
+    """Resolves the installation state of the browsers in pages.yaml."""
+
+    def __init__(self, browsers: list[dict], index: CommandIndex = COMMANDS) -> None:
+        self.browsers = browsers
+        self.index = index
+        self.snapshot: dict[str, BrowserState] = {}
+
+    def check_paths(self, variant: dict) -> list[str]:
+        """Paths whose presence marks ``variant`` as installed."""
+        check = variant.get("check", "")
+        if not check:
+            return []
+        paths = [check]
+        if check.startswith(SYSTEM_FLATPAK_APPS + "/"):
+            paths.append(os.path.join(user_flatpak_apps(), check[len(SYSTEM_FLATPAK_APPS) + 1 :]))
+        return paths
+
+    def _has_desktop(self, desktop: str, app_dirs: list[str]) -> bool:
+        return not desktop or any(desktop in self.index.listing(d) for d in app_dirs)
+
+    def resolve(self, browser: dict, app_dirs: list[str] | None = None) -> BrowserState:
+        """Return the state of one browser, preferring its first installed variant."""
+        if app_dirs is None:
+            app_dirs = application_dirs()
+        for variant in browser.get("variants", []):
+            desktop = variant.get("desktop", "")
+            if any(self.index.exists(p) for p in self.check_paths(variant)) and self._has_desktop(desktop, app_dirs):
+                return BrowserState(True, variant, desktop or None)
+        return NOT_INSTALLED
+
+    def scan(self) -> dict[str, BrowserState]:
+        """Resolve every browser and keep the result as the shared snapshot."""
+        app_dirs = application_dirs()
+        self.snapshot = {b.get("package", ""): self.resolve(b, app_dirs) for b in self.browsers}
+        return self.snapshot
+
+    def update(self, packages: set[str]) -> dict[str, BrowserState]:
+        """Re-resolve only ``packages``; returns the entries that changed."""
+        app_dirs = application_dirs()
+        changed = {}
+        for browser in self.browsers:
+            package = browser.get("package", "")
+            if package not in packages:
+                continue
+            state = self.resolve(browser, app_dirs)
+            if self.snapshot.get(package) != state:
+                self.snapshot[package] = state
+                changed[package] = state
+        return changed
+
+    def state(self, browser: dict) -> BrowserState:
+        """Return the snapshot entry for ``browser``, scanning on first use."""
+        if not self.snapshot:
+            self.scan()
+        return self.snapshot.get(browser.get("package", ""), NOT_INSTALLED)
+
+
+def _is_default_browser_file(name: str) -> bool:
+    # kdeglobals holds the BrowserApplication override on Plasma
+    return name == "mimeapps.list" or name.endswith("-mimeapps.list") or name == "kdeglobals"
+
+
+class BrowserMonitor:
+    """Watches browser installs and default-browser settings."""
+
+    DEBOUNCE_MS = 400
+
+    def __init__(
+        self,
+        detector: BrowserDetector,
+        on_installs_changed: Callable[[dict[str, BrowserState]], None],
+        on_default_changed: Callable[[], None],
+    ) -> None:
+        self.detector = detector
+        self.on_installs_changed = on_installs_changed
+        self.on_default_changed = on_default_changed
+        self._monitors: list[Gio.FileMonitor] = []
+        # directory -> entry name -> packages affected by that entry
+        self._interest: dict[str, dict[str, set[str]]] = {}
+        self._mime_dirs = set(mimeapps_dirs())
+        self._dirty_packages: set[str] = set()
+        self._default_dirty = False
+        self._timeout_id = 0
+
+        for browser in detector.browsers:
+            package = browser.get("package", "")
+            for variant in browser.get("variants", []):
+                for path in detector.check_paths(variant):
+                    parent, name = os.path.split(path.rstrip("/"))
+                    self._add_interest(parent, name, package)
+                desktop = variant.get("desktop", "")
+                if desktop:
+                    for app_dir in application_dirs():
+                        self._add_interest(app_dir, desktop, package)
+
+        for directory in list(self._interest) + sorted(self._mime_dirs - set(self._interest)):
+            self._watch(directory)
+
+    def _add_interest(self, directory: str, name: str, package: str) -> None:
+        self._interest.setdefault(directory, {}).setdefault(name, set()).add(package)
+
+    def _watch(self, directory: str) -> None:
+        try:
+            monitor = Gio.File.new_for_path(directory).monitor_directory(
+                Gio.FileMonitorFlags.WATCH_MOVES, None
+            )
+        except GLib.Error as e:
+            print(f"Error watching {directory}: {e.message}")
+            return
+        monitor.connect("changed", self._on_changed, directory)
+        self._monitors.append(monitor)
+
+    def _on_changed(
+        self,
+        _monitor: Gio.FileMonitor,
+        file: Gio.File,
+        other: Gio.File | None,
+        event: Gio.FileMonitorEvent,
+        directory: str,
+    ) -> None:
+        if event == Gio.FileMonitorEvent.CHANGED:
+            # Wait for CHANGES_DONE_HINT instead of reacting to every write
+            return
+        names = [file.get_basename()]
+        if other is not None:
+            names.append(other.get_basename())
+
+        interest = self._interest.get(directory, {})
+        for name in names:
+            self._dirty_packages.update(interest.get(name, ()))
+            if directory in self._mime_dirs and _is_default_browser_file(name):
+                self._default_dirty = True
+
+        if (self._dirty_packages or self._default_dirty) and not self._timeout_id:
+            self._timeout_id = GLib.timeout_add(self.DEBOUNCE_MS, self._flush)
+
+    def _flush(self) -> bool:
+        """Report the coalesced changes of the last debounce window."""
+        self._timeout_id = 0
+        packages, self._dirty_packages = self._dirty_packages, set()
+        default_dirty, self._default_dirty = self._default_dirty, False
+
+        if packages:
+            changed = self.detector.update(packages)
+            if changed:
+                self.on_installs_changed(changed)
+        if default_dirty:
+            self.on_default_changed()
+        return GLib.SOURCE_REMOVE
+
+    def stop(self) -> None:
+        """Cancel every watch and any pending report."""
+        for monitor in self._monitors:
+            monitor.cancel()
+        self._monitors = []
+        if self._timeout_id:
+            GLib.source_remove(self._timeout_id)
+            self._timeout_id = 0
@@ -0,0 +1,149 @@
+"""Model-backed, virtualized grids of action and browser cards.
+
+Each page keeps its cards as items in a ``Gio.ListStore`` shown by a
+``Gtk.GridView``. The view only creates card widgets for the rows that
+are on screen and reuses them while scrolling, binding each one to
+whichever item it shows next. The column count follows the available
+width, up to a per-page maximum.
+
+Everything a card shows lives in its item, so state survives a widget
+being recycled: the window changes items, and an item's ``changed``
+signal makes the card bound to it, if any, redraw.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from gi.repository import Gio, GObject, Gtk
+
+from browsers import BrowserState
+from textures import LOADER
+
+
+class CardItem(GObject.Object):
+    """One entry of a card grid."""
+
+    __gsignals__ = {"changed": (GObject.SignalFlags.RUN_FIRST, None, ())}
+
+    def notify_changed(self) -> None:
+        self.emit("changed")
+
+
+class ActionItem(CardItem):
+    """An action of pages.yaml."""
+
+    def __init__(self, action: dict) -> None:
+        super().__init__()
+        self.action = action
+        self.installing = False
+
+    def set_installing(self, installing: bool) -> None:
+        self.installing = installing
+        self.notify_changed()
+
+    def on_launch_state(self, _state) -> None:
+        """Launch listener; the card reads the state from the supervisor."""
+        self.notify_changed()
+
+
+class BrowserItem(CardItem):
+    """A browser of the browser page and its install and selection state."""
+
+    def __init__(self, browser: dict, state: BrowserState) -> None:
+        super().__init__()
+        self.browser = browser
+        self.installed = state.installed
+        self.detected_desktop = state.desktop
+        self.selected = False
+        self.queued = False
+        self.loading = False
+        self.install_failed = False
+        # Download estimate: (label, tooltip)
+        self.plan = ("", "")
+        # Install progress: (fraction or None, text); None when not shown
+        self.progress: tuple[float | None, str] | None = None
+
+    def set_installed(self, installed: bool, desktop: str | None = None) -> None:
+        self.installed = installed
+        self.detected_desktop = desktop
+        self.notify_changed()
+
+    def set_selected(self, selected: bool) -> None:
+        if selected != self.selected:
+            self.selected = selected
+            self.notify_changed()
+
+    def set_queued(self, queued: bool) -> None:
+        """Set whether the browser waits in the install queue."""
+        self.queued = queued
+        if queued:
+            self.install_failed = False
+        self.notify_changed()
+
+    def set_install_failed(self, failed: bool) -> None:
+        self.install_failed = failed
+        self.notify_changed()
+
+    def set_loading(self, loading: bool) -> None:
+        self.loading = loading
+        if not loading:
+            self.progress = None
+        self.notify_changed()
+
+    def set_plan(self, text: str, details: str) -> None:
+        """Record what installing the browser would download."""
+        self.plan = (text, details)
+        self.notify_changed()
+
+    def show_progress(self, fraction: float | None, text: str) -> None:
+        """Record install progress; a None fraction leaves only the spinner."""
+        self.progress = (fraction, text)
+        self.notify_changed()
+
+
+def card_grid(
+    items: list[CardItem],
+    create_card: Callable[[], Gtk.Widget],
+    max_columns: int,
+    group: int,
+) -> Gtk.GridView:
+    """Return a grid view showing ``items``.
+
+    The items are kept in a ``Gio.ListStore`` owned by the view's model.
+    ``create_card`` makes an unbound card widget with ``bind(item)`` and
+    ``unbind()`` methods. Icons requested while binding are decoded in the
+    order of the stack page ``group``. The view must be put directly in a
+    ``Gtk.ScrolledWindow`` for only the visible rows to be created.
+    """
+    store = Gio.ListStore(item_type=CardItem)
+    store.splice(0, 0, items)
+
+    factory = Gtk.SignalListItemFactory()
+    factory.connect("setup", _on_setup, create_card)
+    factory.connect("bind", _on_bind, group)
+    factory.connect("unbind", _on_unbind)
+
+    view = Gtk.GridView(model=Gtk.NoSelection(model=store), factory=factory)
+    view.add_css_class("card-grid")
+    view.set_min_columns(1)
+    # Few cards stay together in the middle instead of spreading over the width
+    view.set_max_columns(max(1, min(len(items), max_columns)))
+    view.set_halign(Gtk.Align.CENTER)
+    return view
+
+
+def _on_setup(_factory, list_item: Gtk.ListItem, create_card: Callable[[], Gtk.Widget]) -> None:
+    # The cards are buttons themselves; the grid cell must not take clicks
+    list_item.set_activatable(False)
+    list_item.set_selectable(False)
+    list_item.set_child(create_card())
+
+
+def _on_bind(_factory, list_item: Gtk.ListItem, group: int) -> None:
+    with LOADER.group(group):
+        list_item.get_child().bind(list_item.get_item())
+
+
+def _on_unbind(_factory, list_item: Gtk.ListItem) -> None:
+    list_item.get_child().unbind()
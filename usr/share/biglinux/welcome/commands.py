@@ -0,0 +1,71 @@
+"""Index of the commands available on PATH.
+
+Each directory is listed with one ``scandir`` and the listing is reused
+until the directory's mtime changes, so checking every action of a page
+costs one scan per PATH entry rather than one lookup per command. The
+listings are shared with the browser detection, which checks paths in the
+same directories.
+"""
+
+from __future__ import annotations
+
+import os
+
+DEFAULT_PATH = "/usr/local/sbin:/usr/local/bin:/usr/bin"
+
+
+class CommandIndex:
+    """Directory listings cached by mtime, and command lookup on top of them."""
+
+    def __init__(self) -> None:
+        # directory -> (mtime_ns, entry names)
+        self._listings: dict[str, tuple[int, frozenset[str]]] = {}
+
+    def listing(self, directory: str) -> frozenset[str]:
+        """Return the entries of ``directory``, listing it only when it changed."""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._listings.pop(directory, None)
+            return frozenset()
+
+        cached = self._listings.get(directory)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            with os.scandir(directory) as it:
+                names = frozenset(entry.name for entry in it)
+        except OSError:
+            names = frozenset()
+        self._listings[directory] = (mtime, names)
+        return names
+
+    def exists(self, path: str) -> bool:
+        """Whether ``path`` exists, answered from its parent's listing."""
+        parent, name = os.path.split(path.rstrip("/"))
+        return name in self.listing(parent)
+
+    def lookup(self, name: str) -> str | None:
+        """Return the executable ``name`` resolves to on PATH, or None."""
+        if "/" in name:
+            return name if os.access(name, os.X_OK) else None
+        path = os.environ.get("PATH") or DEFAULT_PATH
+        for directory in dict.fromkeys(path.split(":")):
+            if directory and name in self.listing(directory):
+                candidate = os.path.join(directory, name)
+                if os.access(candidate, os.X_OK) and not os.path.isdir(candidate):
+                    return candidate
+        return None
+
+    def command_available(self, command: str) -> bool:
+        """Whether the program a command line starts is installed."""
+        import shlex
+
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            return False
+        return bool(argv) and self.lookup(argv[0]) is not None
+
+
+COMMANDS = CommandIndex()
@@ -0,0 +1,139 @@
+"""Supervised launching of the programs behind the action cards.
+
+Children are started with ``GLib.spawn_async`` and reaped by a
+``GLib.child_watch_add`` source, so no zombie is left behind while the
+window stays open. Each action has one launch state:
+
+* ``starting`` from the spawn until the program survived ``STARTUP_GRACE_MS``
+  or exited; repeat clicks are dropped meanwhile,
+* ``running`` once it got past the grace period,
+* ``failed`` when it exited with a non-zero status or could not be started,
+* ``idle`` after a clean exit.
+
+An action can have several programs alive at once, e.g. after clicking it
+again once the first one is running. They are tracked by pid and the state
+only leaves ``running`` when the last of them exits. The time from spawn to
+exit of every launch is kept in ``records``.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+from gi.repository import GLib
+
+STARTUP_GRACE_MS = 1500
+
+
+class LaunchState(NamedTuple):
+    """Launch state of one action."""
+
+    phase: str  # idle, starting, running or failed
+    status: int | None = None  # exit status; negative for a signal
+
+
+IDLE = LaunchState("idle")
+
+
+class LaunchRecord(NamedTuple):
+    """Timing of one finished launch."""
+
+    key: str
+    pid: int  # 0 if the program could not be started
+    argv: tuple[str, ...]
+    status: int | None  # None if the program could not be started
+    seconds: float  # from spawn to exit
+
+
+class LaunchSupervisor:
+    """Starts programs, reaps them and reports their launch state."""
+
+    def __init__(self) -> None:
+        self.states: dict[str, LaunchState] = {}
+        self.records: list[LaunchRecord] = []
+        self._listeners: dict[str, Callable[[LaunchState], None]] = {}
+        # Live children: pid -> (key, argv, spawn time)
+        self._children: dict[int, tuple[str, tuple[str, ...], float]] = {}
+        self._grace_ids: dict[int, int] = {}
+
+    def state(self, key: str) -> LaunchState:
+        return self.states.get(key, IDLE)
+
+    def _set_state(self, key: str, state: LaunchState) -> None:
+        self.states[key] = state
+        listener = self._listeners.get(key)
+        if listener:
+            listener(state)
+
+    def launch(self, key: str, argv: list[str], on_state: Callable[[LaunchState], None] | None = None) -> bool:
+        """Start ``argv`` for the action ``key``.
+
+        Returns False when the click was dropped because the previous launch
+        of the same action is still starting, or the program could not be
+        started.
+        """
+        if self.state(key).phase == "starting":
+            return False
+        if on_state:
+            self._listeners[key] = on_state
+
+        started = time.monotonic()
+        flags = (
+            GLib.SpawnFlags.SEARCH_PATH
+            | GLib.SpawnFlags.DO_NOT_REAP_CHILD
+            | GLib.SpawnFlags.STDOUT_TO_DEV_NULL
+            | GLib.SpawnFlags.STDERR_TO_DEV_NULL
+        )
+        try:
+            pid, _stdin, _stdout, _stderr = GLib.spawn_async(argv, flags=flags)
+        except GLib.Error as e:
+            print(f"Action error: {e.message}")
+            self.records.append(LaunchRecord(key, 0, tuple(argv), None, 0.0))
+            self._set_state(key, LaunchState("failed"))
+            return False
+
+        self._set_state(key, LaunchState("starting"))
+        self._children[pid] = (key, tuple(argv), started)
+        self._grace_ids[pid] = GLib.timeout_add(STARTUP_GRACE_MS, self._on_grace_over, pid)
+        GLib.child_watch_add(GLib.PRIORITY_DEFAULT, pid, self._on_exit)
+        return True
+
+    def _live_pids(self, key: str) -> list[int]:
+        return [pid for pid, child in self._children.items() if child[0] == key]
+
+    def _on_grace_over(self, pid: int) -> bool:
+        self._grace_ids.pop(pid, None)
+        key = self._children[pid][0]
+        if self.state(key).phase == "starting":
+            self._set_state(key, LaunchState("running"))
+        return GLib.SOURCE_REMOVE
+
+    def _on_exit(self, pid: int, wait_status: int) -> None:
+        key, argv, started = self._children.pop(pid)
+        GLib.spawn_close_pid(pid)
+        status = os.waitstatus_to_exitcode(wait_status)
+        self.records.append(LaunchRecord(key, pid, argv, status, time.monotonic() - started))
+
+        grace_id = self._grace_ids.pop(pid, 0)
+        if grace_id:
+            GLib.source_remove(grace_id)
+        if status != 0:
+            print(f"Action error: {argv[0]} exited with status {status}")
+
+        live = self._live_pids(key)
+        if live:
+            # An earlier launch is still alive; if the one that just ended was
+            # the starting one, the card is back to showing the running one
+            if self.state(key).phase == "starting" and not any(p in self._grace_ids for p in live):
+                self._set_state(key, LaunchState("running"))
+            return
+        if status != 0:
+            self._set_state(key, LaunchState("failed", status))
+        else:
+            self._set_state(key, IDLE)
+
+
+SUPERVISOR = LaunchSupervisor()
@@ -11,374 +11,314 @@ Clean, performant implementation using:
 from __future__ import annotations
 
 import gettext
-import locale
 import math
 import os
-import platform
-import shlex
-import shutil
-import subprocess
+import sys
 import threading
+import time
+from array import array
+from typing import TYPE_CHECKING
 
-import gi
+import autostart
+import mimeapps
+from commands import COMMANDS
+from pages_cache import load_pages
+from startup_profile import PROFILER
 
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
+# welcome.py has run autostart.handle() before importing this module
+if autostart.deferred_seconds:
+    PROFILER.note("autostart_deferred_ms", round(autostart.deferred_seconds * 1000, 3))
 
-import cairo  # noqa: E402
-import yaml  # noqa: E402
-from gi.repository import Adw, Gdk, GdkPixbuf, GLib, Gtk  # noqa: E402
+with PROFILER.phase("import:gi"):
+    import gi
+
+    gi.require_version("Gtk", "4.0")
+    gi.require_version("Adw", "1")
+
+    from gi.repository import Adw, Gdk, Gio, GLib, Gtk, Pango
+
+    import procs
+    import resources
+    from browsers import NOT_INSTALLED, BrowserDetector, BrowserMonitor, BrowserState
+    from card_grid import ActionItem, BrowserItem, card_grid
+    from launcher import SUPERVISOR, LaunchState
+    from state import ACTIONS, BROWSERS, SETUP, WINDOW, StateStore
+    from textures import LOADER, set_image_source, texture_image, theme_image
+
+# Modules only some pages or clicks need are imported where they are used;
+# import_budget.py keeps them out of startup
+if TYPE_CHECKING:
+    import cairo
+
+    from pacman_db import InstallPlan
 
 # Internationalization
 DOMAIN = "biglinux-welcome"
 LOCALE_DIR = "/usr/share/locale"
-locale.setlocale(locale.LC_ALL, "")
-locale.bindtextdomain(DOMAIN, LOCALE_DIR)
-gettext.bindtextdomain(DOMAIN, LOCALE_DIR)
-gettext.textdomain(DOMAIN)
 _ = gettext.gettext
 
-APP_PATH = os.path.dirname(os.path.abspath(__file__))
 
-# Premium CSS with elegant animations
-PREMIUM_CSS = """
-/* Base window with subtle gradient feel */
-window.background {
-    background: @window_bg_color;
-}
-
-headerbar.flat {
-    background: transparent;
-    border: none;
-    box-shadow: none;
-}
-
-.logo-container {
-    padding: 20px;
-    min-width: 180px;
-    min-height: 180px;
-}
-
-.logo-image {
-    min-width: 130px;
-    min-height: 130px;
-}
-
-.hero-title {
-    font-size: 36px;
-    font-weight: 900;
-    letter-spacing: -1.2px;
-}
-
-.hero-subtitle {
-    font-size: 15px;
-    font-weight: 400;
-    opacity: 0.55;
-    letter-spacing: 0.2px;
-}
-
-.hero-version {
-    font-size: 11px;
-    font-weight: 700;
-    letter-spacing: 1.5px;
-    text-transform: uppercase;
-    padding: 6px 16px;
-    border-radius: 100px;
-    background: alpha(@accent_bg_color, 0.12);
-    color: @accent_color;
-}
-
-/* System Info Card - Refined glassmorphism with subtle shine */
-.info-card {
-    background: alpha(@card_bg_color, 0.55);
-    border-radius: 16px;
-    padding: 14px 28px;
-    border: 1px solid alpha(@borders, 0.06);
-    border-top: 1px solid alpha(white, 0.1);
-    box-shadow: 0 4px 20px alpha(black, 0.03),
-                0 1px 3px alpha(black, 0.02);
-}
-
-.info-row { padding: 5px 0; }
-.info-key { font-size: 10px; font-weight: 700; opacity: 0.4; letter-spacing: 1px; text-transform: uppercase; }
-.info-value { font-size: 13px; font-weight: 500; }
-
-/* Page Headers - Strong typography */
-.page-title { 
-    font-size: 32px; 
-    font-weight: 900; 
-    letter-spacing: -0.8px;
-}
-
-.page-subtitle { 
-    font-size: 15px; 
-    opacity: 0.5; 
-    letter-spacing: 0.1px;
-    line-height: 1.5;
-}
-
-/* Action Cards - Modern elevated style with subtle shine */
-.action-card {
-    background: alpha(@card_bg_color, 0.5);
-    border-radius: 18px;
-    border: 1px solid alpha(@borders, 0.06);
-    border-top: 1px solid alpha(white, 0.08);
-    padding: 18px 14px;
-    min-width: 125px;
-    min-height: 120px;
-    box-shadow: 0 2px 12px alpha(black, 0.02), 
-                0 1px 3px alpha(black, 0.03);
-}
-
-.action-card:hover {
-    background: alpha(@card_bg_color, 0.85);
-    border: 1px solid alpha(@accent_bg_color, 0.15);
-    border-top: 1px solid alpha(white, 0.15);
-    box-shadow: 0 8px 32px alpha(black, 0.06),
-                0 2px 8px alpha(black, 0.04);
-}
-
-.action-icon {
-    min-width: 52px;
-    min-height: 52px;
-}
-
-.action-icon-box {
-    background: transparent;
-    border-radius: 14px;
-    padding: 8px;
-}
-
-.action-label { 
-    font-size: 12px; 
-    font-weight: 700;
-    opacity: 0.85;
-    letter-spacing: 0.1px;
-}
-
-/* QR Code special styling */
-.qrcode-card {
-    min-width: 240px;
-    min-height: 280px;
-    background: alpha(@card_bg_color, 0.7);
-    border-radius: 24px;
-}
-
-.qrcode-card .action-icon-box {
-    background: white;
-    border-radius: 16px;
-    padding: 12px;
-}
-
-/* Browser Cards - Premium selection UI with subtle shine */
-.browser-card {
-    background: alpha(@card_bg_color, 0.5);
-    border-radius: 20px;
-    border: 2px solid transparent;
-    border-top: 1px solid alpha(white, 0.08);
-    padding: 18px 16px;
-    min-width: 130px;
-    min-height: 135px;
-    box-shadow: 0 2px 12px alpha(black, 0.02),
-                0 1px 3px alpha(black, 0.03);
-}
-
-.browser-card:hover {
-    background: alpha(@card_bg_color, 0.85);
-    border: 2px solid alpha(@accent_bg_color, 0.15);
-    border-top: 1px solid alpha(white, 0.15);
-    box-shadow: 0 8px 32px alpha(black, 0.06),
-                0 2px 8px alpha(black, 0.04);
-}
-
-.browser-card.selected {
-    background: alpha(@accent_bg_color, 0.1);
-    border: 2px solid @accent_bg_color;
-    border-top: 2px solid mix(@accent_bg_color, white, 0.7);
-    box-shadow: 0 4px 24px alpha(@accent_bg_color, 0.2),
-                0 0 0 1px alpha(@accent_bg_color, 0.1);
-}
-
-.browser-card.dimmed { opacity: 0.45; }
-.browser-card.dimmed:hover { opacity: 0.65; }
-
-.browser-icon {
-    min-width: 60px;
-    min-height: 60px;
-}
-
-.browser-icon-bg {
-    background: transparent;
-    border-radius: 16px;
-    padding: 6px;
-}
-
-.browser-label { 
-    font-size: 12px; 
-    font-weight: 700;
-    opacity: 0.85;
-}
-
-.check-badge {
-    background: @success_bg_color;
-    border-radius: 50%;
-    padding: 4px;
-    box-shadow: 0 2px 8px alpha(@success_bg_color, 0.3);
-}
-
-/* Progress Indicator - iOS-inspired pills */
-.progress-container { padding: 6px 0; }
-
-.progress-dot {
-    min-width: 10px;
-    min-height: 10px;
-    border-radius: 50%;
-    background: alpha(@theme_fg_color, 0.12);
-}
-
-.progress-dot.active {
-    min-width: 32px;
-    border-radius: 100px;
-    background: @accent_bg_color;
-    box-shadow: 0 2px 8px alpha(@accent_bg_color, 0.3);
-}
-
-.progress-dot.completed {
-    background: alpha(@accent_bg_color, 0.4);
-}
-
-/* Navigation Buttons - Minimal and elegant */
-.nav-button {
-    min-width: 44px;
-    min-height: 44px;
-    border-radius: 50%;
-}
-
-.nav-button.back {
-    background: alpha(@theme_fg_color, 0.05);
-    color: alpha(@theme_fg_color, 0.6);
-}
-
-.nav-button.back:hover {
-    background: alpha(@theme_fg_color, 0.1);
-    color: alpha(@theme_fg_color, 0.8);
-}
-
-.nav-button.next {
-    background: @accent_bg_color;
-    color: white;
-    box-shadow: 0 4px 16px alpha(@accent_bg_color, 0.3);
-}
-
-.nav-button.next:hover {
-    box-shadow: 0 6px 20px alpha(@accent_bg_color, 0.4);
-}
-
-.finish-button {
-    padding: 12px 32px;
-    border-radius: 100px;
-    font-weight: 700;
-    font-size: 14px;
-    letter-spacing: 0.3px;
-    background: @accent_bg_color;
-    color: white;
-    box-shadow: 0 4px 16px alpha(@accent_bg_color, 0.3);
-}
-
-.finish-button:hover {
-    box-shadow: 0 6px 24px alpha(@accent_bg_color, 0.4);
-}
-
-/* Bottom Bar */
-.bottom-bar { padding: 14px 28px 22px 28px; }
-.startup-check { font-size: 13px; opacity: 0.5; font-weight: 500; }
-
-/* Placeholder classes for animations */
-.animate-1 { }
-.animate-2 { }
-.animate-3 { }
-.animate-4 { }
-"""
+def setup_locale() -> None:
+    """Bind the translations; called from main() rather than at import."""
+    import locale
+
+    with PROFILER.phase("locale"):
+        locale.setlocale(locale.LC_ALL, "")
+        locale.bindtextdomain(DOMAIN, LOCALE_DIR)
+        gettext.bindtextdomain(DOMAIN, LOCALE_DIR)
+        gettext.textdomain(DOMAIN)
+
+
+APP_PATH = os.path.dirname(os.path.abspath(__file__))
+# Installed build stamp: pacman gives every packaged file the build time as mtime
+APP_VERSION = str(os.stat(os.path.abspath(__file__)).st_mtime_ns)
+# Alternative pages.yaml, e.g. the synthetic catalogs of the benchmarks
+PAGES_ENV = "BIGLINUX_WELCOME_PAGES"
+# Most cards per grid row; fewer when the window is narrow
+ACTION_COLUMNS = 4
+BROWSER_COLUMNS = 5
 
 
 def load_icon(name: str, size: int = 64) -> Gtk.Image:
-    """Load icon from various sources."""
-    img = None
+    """Load icon from various sources.
 
+    Returns a placeholder right away; the icon is decoded in the background.
+    """
     # Check if it's a local file (svg/png)
     if name.endswith((".svg", ".png")):
-        path = os.path.join(APP_PATH, "image", name)
-        if os.path.exists(path):
-            try:
-                pb = GdkPixbuf.Pixbuf.new_from_file_at_size(path, size, size)
-                img = Gtk.Image.new_from_pixbuf(pb)
-            except GLib.Error:
-                pass
+        return texture_image(resources.asset(f"image/{name}"), size, "image-missing")
+
+    # Theme icon
+    return theme_image(name or "application-x-executable", size)
+
+
+def update_icon(img: Gtk.Image | None, name: str, size: int) -> Gtk.Image:
+    """Show ``name`` in ``img`` when it can be reused, else return a new image."""
+    if img is not None and name.endswith((".svg", ".png")) and getattr(img, "source", None):
+        set_image_source(img, resources.asset(f"image/{name}"), size, "image-missing")
+        return img
+    return load_icon(name, size)
 
-    # Try as theme icon
-    if img is None:
-        img = Gtk.Image.new_from_icon_name(name or "application-x-executable")
 
-    # Always set pixel size
-    img.set_pixel_size(size)
-    return img
+def browser_icon_path(package: str) -> str:
+    return resources.asset(f"image/browsers/{package}.svg")
 
 
 def load_browser_icon(package: str, size: int = 64) -> Gtk.Image:
     """Load browser icon from browsers folder."""
-    path = os.path.join(APP_PATH, "image", "browsers", f"{package}.svg")
-    img = None
+    return texture_image(browser_icon_path(package), size, "web-browser-symbolic")
 
-    if os.path.exists(path):
-        try:
-            pb = GdkPixbuf.Pixbuf.new_from_file_at_size(path, size, size)
-            img = Gtk.Image.new_from_pixbuf(pb)
-        except GLib.Error:
-            pass
 
-    # Fallback to theme icon
-    if img is None:
-        img = Gtk.Image.new_from_icon_name("web-browser-symbolic")
-
-    # Always set pixel size
-    img.set_pixel_size(size)
-    return img
+def set_css_class(widget: Gtk.Widget, name: str, enabled: bool) -> None:
+    if enabled:
+        widget.add_css_class(name)
+    else:
+        widget.remove_css_class(name)
 
 
 class AnimatedLogo(Gtk.DrawingArea):
-    """Animated glow effect around logo using Cairo."""
+    """Animated glow effect around logo using Cairo.
+
+    Driven by the frame clock with time-based motion. The animation only
+    ticks while it can be seen: it pauses when its stack page is not the
+    visible child, when the toplevel is hidden, minimized or suspended
+    (occluded), and when ``gtk-enable-animations`` is off.
+    """
+
+    # Redraw at most ~30 times per second; motion stays time-based
+    FRAME_INTERVAL_US = 33_000
+    # Largest step applied after a stall, so a resume does not jump
+    MAX_STEP = 0.1
+    PARTICLES = 8
+    RING_RADII = (60, 72, 85)
+    # Particle looks: (core radius, alpha) indexed by kind
+    PARTICLE_KINDS = ((3, 0.3), (4, 0.45), (5, 0.6))
 
     def __init__(self, logo_widget: Gtk.Widget) -> None:
         super().__init__()
         self.logo_widget = logo_widget
         self.time = 0.0
-        self.particles: list[dict] = []
-
-        # Create 8 particles orbiting
-        for i in range(8):
-            angle = (i / 8) * 2 * math.pi
-            self.particles.append({
-                "angle": angle,
-                "speed": 0.3 + (i % 3) * 0.1,  # Varied speeds
-                "radius": 75 + (i % 2) * 12,  # Varied orbit radii
-                "size": 3 + (i % 3),
-                "alpha": 0.3 + (i % 3) * 0.15,
-            })
+
+        # 8 orbiting particles, one array per attribute
+        count = self.PARTICLES
+        self.angles = array("d", ((i / count) * 2 * math.pi for i in range(count)))
+        self.speeds = array("d", (0.3 + (i % 3) * 0.1 for i in range(count)))  # Varied speeds
+        self.radii = array("d", (75 + (i % 2) * 12 for i in range(count)))  # Varied orbit radii
+        self.kinds = array("B", (i % 3 for i in range(count)))
+
+        # Rendered once per size, scale and accent color, then recomposited
+        self._color: tuple[float, float, float] | None = None
+        self._layers_key: tuple | None = None
+        self._ring_layer: cairo.ImageSurface | None = None
+        self._sprites: list[tuple[cairo.ImageSurface, float]] = []
+
+        # Per-frame draw cost in milliseconds
+        self.draw_count = 0
+        self.draw_total_ms = 0.0
+        self.draw_max_ms = 0.0
+
+        self._style_manager = Adw.StyleManager.get_default()
+        self._style_handlers = [
+            self._style_manager.connect(f"notify::{prop}", self._on_style_changed)
+            for prop in ("dark", "high-contrast", "accent-color-rgba")
+            if self._style_manager.find_property(prop)
+        ]
 
         self.set_size_request(185, 185)
         self.set_draw_func(self._draw)
 
-        # Start animation at ~20fps
-        self.timer_id = GLib.timeout_add(50, self._animate)
-
-    def _animate(self) -> bool:
-        """Update animation state."""
-        self.time += 0.05
-        for p in self.particles:
-            p["angle"] += p["speed"] * 0.05
+        self.stopped = False
+        self._tick_id = 0
+        self._last_frame_time = 0
+        self._last_draw_time = 0
+        self._stack: Gtk.Stack | None = None
+        self._stack_handler = 0
+        self._surface: Gdk.Surface | None = None
+        self._surface_handler = 0
+
+        self._settings = Gtk.Settings.get_default()
+        self._settings_handler = self._settings.connect(
+            "notify::gtk-enable-animations", self._update_running
+        )
+        self.connect("map", self._on_map)
+        self.connect("unmap", self._on_unmap)
+        self.connect("destroy", self._on_destroy)
+
+    def _on_map(self, _widget: Gtk.Widget) -> None:
+        """Watch the stack page and the toplevel state while mapped."""
+        self._stack = self.get_ancestor(Gtk.Stack)
+        if self._stack:
+            self._stack_handler = self._stack.connect("notify::visible-child", self._update_running)
+
+        native = self.get_native()
+        self._surface = native.get_surface() if native else None
+        if isinstance(self._surface, Gdk.Toplevel):
+            self._surface_handler = self._surface.connect("notify::state", self._update_running)
+
+        self._update_running()
+
+    def _on_unmap(self, _widget: Gtk.Widget) -> None:
+        """Stop ticking and drop the signal connections made on map."""
+        if self._stack_handler:
+            self._stack.disconnect(self._stack_handler)
+            self._stack_handler = 0
+        if self._surface_handler:
+            self._surface.disconnect(self._surface_handler)
+            self._surface_handler = 0
+        self._stack = None
+        self._surface = None
+        self._update_running()
+
+    def _on_destroy(self, _widget: Gtk.Widget) -> None:
+        if self._settings_handler:
+            self._settings.disconnect(self._settings_handler)
+            self._settings_handler = 0
+        for handler in self._style_handlers:
+            self._style_manager.disconnect(handler)
+        self._style_handlers = []
+
+    def _on_style_changed(self, *_args) -> None:
+        """Forget the cached accent color and layers after a style change."""
+        self._color = None
+        self._layers_key = None
         self.queue_draw()
+
+    def _accent_color(self) -> tuple[float, float, float]:
+        """Return the Adwaita accent color, looked up once per style change."""
+        if self._color is None:
+            color = self.get_style_context().lookup_color("accent_bg_color")
+            if color[0]:
+                self._color = (color[1].red, color[1].green, color[1].blue)
+            else:
+                self._color = (0.33, 0.56, 0.85)  # Blue fallback
+        return self._color
+
+    def _build_layers(self, cr: cairo.Context, width: int, height: int) -> None:
+        """Render the glow rings and particle sprites into image surfaces."""
+        r, g, b = self._accent_color()
+        scale_x, scale_y = cr.get_target().get_device_scale()
+        key = (width, height, scale_x, scale_y, r, g, b)
+        if key == self._layers_key:
+            return
+
+        # PyGObject loads pycairo with the first draw; nothing before needs it
+        with PROFILER.phase("import:cairo"):
+            import cairo
+
+        def new_layer(w: float, h: float) -> tuple[cairo.ImageSurface, cairo.Context]:
+            surface = cairo.ImageSurface(
+                cairo.FORMAT_ARGB32, math.ceil(w * scale_x), math.ceil(h * scale_y)
+            )
+            surface.set_device_scale(scale_x, scale_y)
+            return surface, cairo.Context(surface)
+
+        # Rings at their relative strength; the breathing alpha is applied when painting
+        self._ring_layer, ctx = new_layer(width, height)
+        ctx.set_line_width(2)
+        for radius in self.RING_RADII:
+            ctx.set_source_rgba(r, g, b, 1 - (radius - 60) / 35)
+            ctx.arc(width / 2, height / 2, radius, 0, 2 * math.pi)
+            ctx.stroke()
+
+        # One sprite per particle kind: soft glow plus solid core
+        self._sprites = []
+        for size, alpha in self.PARTICLE_KINDS:
+            half = size + 3
+            sprite, ctx = new_layer(2 * half, 2 * half)
+            ctx.set_source_rgba(r, g, b, alpha * 0.5)
+            ctx.arc(half, half, size + 2, 0, 2 * math.pi)
+            ctx.fill()
+            ctx.set_source_rgba(r, g, b, alpha)
+            ctx.arc(half, half, size, 0, 2 * math.pi)
+            ctx.fill()
+            self._sprites.append((sprite, half))
+
+        self._layers_key = key
+
+    def _should_run(self) -> bool:
+        """Whether the animation is currently visible to the user."""
+        if self.stopped or not self.get_mapped():
+            return False
+        if not self._settings.get_property("gtk-enable-animations"):
+            return False
+
+        if self._stack:
+            page = self._stack.get_visible_child()
+            if page is None or not self.is_ancestor(page):
+                return False
+
+        if isinstance(self._surface, Gdk.Toplevel):
+            hidden = Gdk.ToplevelState.MINIMIZED
+            # Wayland compositors report occluded windows as suspended (GTK >= 4.12)
+            suspended = getattr(Gdk.ToplevelState, "SUSPENDED", None)
+            if suspended is not None:
+                hidden |= suspended
+            if self._surface.get_state() & hidden:
+                return False
         return True
 
+    def _update_running(self, *_args) -> None:
+        """Add or remove the tick callback to match visibility."""
+        should_run = self._should_run()
+        if should_run and not self._tick_id:
+            self._last_frame_time = 0
+            self._tick_id = self.add_tick_callback(self._on_tick)
+        elif not should_run and self._tick_id:
+            self.remove_tick_callback(self._tick_id)
+            self._tick_id = 0
+
+    def _on_tick(self, _widget: Gtk.Widget, clock: Gdk.FrameClock) -> bool:
+        """Advance the animation by the time since the previous frame."""
+        now = clock.get_frame_time()
+        if self._last_frame_time:
+            self.time += min((now - self._last_frame_time) / 1_000_000, self.MAX_STEP)
+        self._last_frame_time = now
+
+        if now - self._last_draw_time >= self.FRAME_INTERVAL_US:
+            self._last_draw_time = now
+            self.queue_draw()
+        return GLib.SOURCE_CONTINUE
+
     def _draw(
         self,
         _area: Gtk.DrawingArea,
@@ -386,45 +326,41 @@ class AnimatedLogo(Gtk.DrawingArea):
         width: int,
         height: int,
     ) -> None:
-        """Draw particles with Cairo."""
+        """Composite the cached layers for the current time."""
+        start = time.perf_counter()
+        self._build_layers(cr, width, height)
         cx, cy = width / 2, height / 2
-
-        # Get accent color from Adwaita
-        style = self.get_style_context()
-        color = style.lookup_color("accent_bg_color")
-        if color[0]:
-            r, g, b = color[1].red, color[1].green, color[1].blue
-        else:
-            r, g, b = 0.33, 0.56, 0.85  # Blue fallback
-
-        # Draw subtle glow ring (breathing effect)
-        glow_alpha = 0.08 + 0.04 * math.sin(self.time * 1.5)
-        for radius in [60, 72, 85]:
-            alpha = glow_alpha * (1 - (radius - 60) / 35)
-            cr.set_source_rgba(r, g, b, alpha)
-            cr.arc(cx, cy, radius, 0, 2 * math.pi)
-            cr.set_line_width(2)
-            cr.stroke()
-
-        # Draw orbiting particles
-        for p in self.particles:
-            px = cx + math.cos(p["angle"]) * p["radius"]
-            py = cy + math.sin(p["angle"]) * p["radius"]
-
-            # Particle with glow
-            cr.set_source_rgba(r, g, b, p["alpha"] * 0.5)
-            cr.arc(px, py, p["size"] + 2, 0, 2 * math.pi)
-            cr.fill()
-
-            cr.set_source_rgba(r, g, b, p["alpha"])
-            cr.arc(px, py, p["size"], 0, 2 * math.pi)
-            cr.fill()
+        t = self.time
+
+        # Subtle glow ring (breathing effect)
+        cr.set_source_surface(self._ring_layer, 0, 0)
+        cr.paint_with_alpha(0.08 + 0.04 * math.sin(t * 1.5))
+
+        # Orbiting particles
+        sprites = self._sprites
+        for angle, speed, radius, kind in zip(self.angles, self.speeds, self.radii, self.kinds):
+            angle += speed * t
+            sprite, half = sprites[kind]
+            cr.set_source_surface(sprite, cx + math.cos(angle) * radius - half, cy + math.sin(angle) * radius - half)
+            cr.paint()
+
+        elapsed = (time.perf_counter() - start) * 1000
+        self.draw_count += 1
+        self.draw_total_ms += elapsed
+        self.draw_max_ms = max(self.draw_max_ms, elapsed)
+
+    def frame_cost(self) -> dict:
+        """Return the measured per-frame draw cost in milliseconds."""
+        return {
+            "frames": self.draw_count,
+            "mean_ms": self.draw_total_ms / self.draw_count if self.draw_count else 0.0,
+            "max_ms": self.draw_max_ms,
+        }
 
     def stop(self) -> None:
         """Stop animation."""
-        if self.timer_id:
-            GLib.source_remove(self.timer_id)
-            self.timer_id = None
+        self.stopped = True
+        self._update_running()
 
 
 class InfoCard(Gtk.Box):
@@ -436,7 +372,7 @@ class InfoCard(Gtk.Box):
         self.set_halign(Gtk.Align.CENTER)
 
         infos = [
-            (_("Kernel"), platform.release()),
+            (_("Kernel"), os.uname().release),
             (_("Desktop"), self._get_desktop()),
             (_("Display"), os.environ.get("XDG_SESSION_TYPE", "Unknown").title()),
         ]
@@ -470,18 +406,18 @@ class InfoCard(Gtk.Box):
 
 
 class ActionCard(Gtk.Button):
-    """Action card widget."""
+    """Action card widget; the page's card grid binds it to an ActionItem."""
 
-    def __init__(self, action: dict) -> None:
+    def __init__(self, on_install=None, on_done=None) -> None:
         super().__init__()
-        self.action = action
+        self.item: ActionItem | None = None
+        self.on_install = on_install
+        self.on_done = on_done
+        self.available = True
+        self._changed_id = 0
 
         self.add_css_class("flat")
         self.add_css_class("action-card")
-        # Larger card for QR codes
-        if "qrcode" in action.get("icon", "").lower():
-            self.add_css_class("qrcode-card")
-        self.set_tooltip_text(_(action.get("label", "")))
         self.connect("clicked", self._on_click)
 
         content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
@@ -489,69 +425,140 @@ class ActionCard(Gtk.Button):
         content.set_valign(Gtk.Align.CENTER)
         self.set_child(content)
 
-        # Icon box
-        icon_box = Gtk.Box()
-        icon_box.add_css_class("action-icon-box")
-        icon_box.set_halign(Gtk.Align.CENTER)
-        content.append(icon_box)
-
-        # Icon - larger size for QR codes
-        icon_name = action.get("icon", "")
-        icon_size = 200 if "qrcode" in icon_name.lower() else 64
-        icon = load_icon(icon_name, icon_size)
-        icon.add_css_class("action-icon")
-        icon_box.append(icon)
+        # Icon box; the icon itself is added on bind
+        self.icon_box = Gtk.Box()
+        self.icon_box.add_css_class("action-icon-box")
+        self.icon_box.set_halign(Gtk.Align.CENTER)
+        content.append(self.icon_box)
+        self.icon: Gtk.Image | None = None
 
         # Label
-        label = Gtk.Label(label=_(action.get("label", "")))
-        label.add_css_class("action-label")
-        label.set_max_width_chars(11)
-        label.set_wrap(True)
-        label.set_justify(Gtk.Justification.CENTER)
-        content.append(label)
+        self.label = Gtk.Label()
+        self.label.add_css_class("action-label")
+        self.label.set_max_width_chars(11)
+        self.label.set_wrap(True)
+        self.label.set_justify(Gtk.Justification.CENTER)
+        content.append(self.label)
+
+    @property
+    def action(self) -> dict:
+        return self.item.action if self.item else {}
+
+    def bind(self, item: ActionItem) -> None:
+        """Show ``item``; called whenever the grid recycles the card."""
+        self.item = item
+        icon_name = item.action.get("icon", "")
+        is_qrcode = "qrcode" in icon_name.lower()
+        # Larger card and icon for QR codes
+        set_css_class(self, "qrcode-card", is_qrcode)
+        icon = update_icon(self.icon, icon_name, 200 if is_qrcode else 64)
+        if icon is not self.icon:
+            if self.icon is not None:
+                self.icon_box.remove(self.icon)
+            icon.add_css_class("action-icon")
+            self.icon_box.append(icon)
+            self.icon = icon
+        self.label.set_label(_(item.action.get("label", "")))
+
+        self._changed_id = item.connect("changed", self._sync)
+        self._sync()
+
+    def unbind(self) -> None:
+        if self.item is not None:
+            self.item.disconnect(self._changed_id)
+            self.item = None
+
+    def _sync(self, *_args) -> None:
+        """Show the availability, launch and install state of the item."""
+        self.refresh_availability()
+        # Another card for the same command may have launched it already
+        self._show_launch_state(SUPERVISOR.state(self._launch_key()))
+        if self.item.installing:
+            self.add_css_class("launching")
+            self.set_tooltip_text(_("Installing {package}…").format(package=self.action.get("package", "")))
+
+    def refresh_availability(self) -> bool:
+        """Mark the card when the program it starts is not installed."""
+        if self.action.get("type", "") == "app":
+            self.available = COMMANDS.command_available(self.action.get("command", ""))
+        else:
+            self.available = True
+        label = _(self.action.get("label", ""))
+        if self.available:
+            self.remove_css_class("unavailable")
+            self.set_tooltip_text(label)
+        else:
+            self.add_css_class("unavailable")
+            package = self.action.get("package")
+            if package and self.on_install:
+                self.set_tooltip_text(_("{name} is not installed. Click to install {package}").format(name=label, package=package))
+            else:
+                self.set_tooltip_text(_("{name} is not installed").format(name=label))
+        return self.available
+
+    def _launch_key(self) -> str:
+        return f"{self.action.get('type', '')}:{self.action.get('command', '')}"
 
     def _on_click(self, _btn: Gtk.Button) -> None:
         """Handle click."""
+        if self.item is None:
+            return
         action_type = self.action.get("type", "")
         command = self.action.get("command", "")
 
+        if not self.available:
+            if self.action.get("package") and self.on_install and not self.item.installing:
+                self.on_install(self.item)
+            return
+
+        import shlex
+
+        started = False
         try:
             if action_type == "app":
-                subprocess.Popen(
-                    shlex.split(command),
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
+                started = SUPERVISOR.launch(self._launch_key(), shlex.split(command), self.item.on_launch_state)
             elif action_type == "url":
                 Gtk.show_uri(None, command, Gdk.CURRENT_TIME)
+                started = True
             elif action_type == "script":
                 script = os.path.join(APP_PATH, command)
-                subprocess.Popen(
-                    shlex.split(script),
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-        except OSError as e:
+                started = SUPERVISOR.launch(self._launch_key(), shlex.split(script), self.item.on_launch_state)
+        except ValueError as e:
             print(f"Action error: {e}")
+        if started and self.on_done:
+            self.on_done(self._launch_key())
+
+    def _show_launch_state(self, state: LaunchState) -> None:
+        """Reflect the supervisor's launch state on the card."""
+        label = _(self.action.get("label", ""))
+        if state.phase == "starting":
+            self.add_css_class("launching")
+            self.set_tooltip_text(_("Starting {name}…").format(name=label))
+        else:
+            self.remove_css_class("launching")
+
+        if state.phase == "failed":
+            self.add_css_class("launch-failed")
+            if state.status is None:
+                self.set_tooltip_text(_("{name} could not be started").format(name=label))
+            else:
+                self.set_tooltip_text(_("{name} exited with status {status}").format(name=label, status=state.status))
+        else:
+            # Idle and running keep the tooltip refresh_availability() set
+            self.remove_css_class("launch-failed")
 
 
 class BrowserCard(Gtk.Button):
-    """Browser selection card."""
+    """Browser selection card; the browser grid binds it to a BrowserItem."""
 
-    def __init__(self, browser: dict, on_select) -> None:
+    def __init__(self, on_select) -> None:
         super().__init__()
-        self.browser = browser
+        self.item: BrowserItem | None = None
         self.on_select = on_select
-        self.selected = False
-        self.installed = self._check_installed()
+        self._changed_id = 0
 
         self.add_css_class("flat")
         self.add_css_class("browser-card")
-
-        if not self.installed:
-            self.add_css_class("dimmed")
-
-        self.set_tooltip_text(browser.get("label", ""))
         self.connect("clicked", self._on_click)
 
         content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
@@ -566,15 +573,11 @@ class BrowserCard(Gtk.Button):
         overlay.set_halign(Gtk.Align.CENTER)
         content.append(overlay)
 
-        # Icon background
-        icon_bg = Gtk.Box()
-        icon_bg.add_css_class("browser-icon-bg")
-        overlay.set_child(icon_bg)
-
-        # Icon
-        icon = load_browser_icon(browser.get("package", ""), 56)
-        icon.add_css_class("browser-icon")
-        icon_bg.append(icon)
+        # Icon background; the icon itself is added on bind
+        self.icon_bg = Gtk.Box()
+        self.icon_bg.add_css_class("browser-icon-bg")
+        overlay.set_child(self.icon_bg)
+        self.icon: Gtk.Image | None = None
 
         # Check badge (initially hidden)
         self.check_badge = Gtk.Box()
@@ -596,52 +599,86 @@ class BrowserCard(Gtk.Button):
         overlay.add_overlay(self.spinner)
 
         # Label
-        label = Gtk.Label(label=browser.get("label", ""))
-        label.add_css_class("browser-label")
-        label.set_max_width_chars(12)
-        label.set_wrap(True)
-        content.append(label)
-
-    def _check_installed(self) -> bool:
-        """Check if browser is installed."""
-        for variant in self.browser.get("variants", []):
-            check_path = variant.get("check", "")
-            if check_path and os.path.exists(check_path):
-                return True
-        return False
-
-    def set_installed(self, installed: bool) -> None:
-        """Set installation state."""
-        self.installed = installed
-        if installed:
-            self.remove_css_class("dimmed")
+        self.label = Gtk.Label()
+        self.label.add_css_class("browser-label")
+        self.label.set_max_width_chars(12)
+        self.label.set_wrap(True)
+        content.append(self.label)
+
+        # Download estimate, filled in once the install plan is known
+        self.plan_label = Gtk.Label()
+        self.plan_label.add_css_class("install-plan")
+        self.plan_label.set_visible(False)
+        content.append(self.plan_label)
+
+        # Install progress, shown while the card's package is being installed
+        self.progress_bar = Gtk.ProgressBar()
+        self.progress_bar.add_css_class("install-progress")
+        self.progress_bar.set_visible(False)
+        content.append(self.progress_bar)
+
+        self.status_label = Gtk.Label()
+        self.status_label.add_css_class("install-status")
+        self.status_label.set_max_width_chars(14)
+        self.status_label.set_ellipsize(Pango.EllipsizeMode.END)
+        self.status_label.set_visible(False)
+        content.append(self.status_label)
+
+    def bind(self, item: BrowserItem) -> None:
+        """Show ``item``; called whenever the grid recycles the card."""
+        self.item = item
+        package = item.browser.get("package", "")
+        if self.icon is None:
+            self.icon = load_browser_icon(package, 56)
+            self.icon.add_css_class("browser-icon")
+            self.icon_bg.append(self.icon)
         else:
-            self.add_css_class("dimmed")
-
-    def set_selected(self, selected: bool) -> None:
-        """Set selection state."""
-        self.selected = selected
-        if selected:
-            self.add_css_class("selected")
-            self.check_badge.set_visible(True)
+            set_image_source(self.icon, browser_icon_path(package), 56, "web-browser-symbolic")
+        self.label.set_label(item.browser.get("label", ""))
+
+        self._changed_id = item.connect("changed", self._sync)
+        self._sync()
+
+    def unbind(self) -> None:
+        if self.item is not None:
+            self.item.disconnect(self._changed_id)
+            self.item = None
+
+    def _sync(self, *_args) -> None:
+        """Show the install, selection and progress state of the item."""
+        item = self.item
+        label = item.browser.get("label", "")
+        set_css_class(self, "dimmed", not item.installed or item.loading)
+        set_css_class(self, "selected", item.selected)
+        set_css_class(self, "queued", item.queued)
+        set_css_class(self, "install-failed", item.install_failed)
+        self.check_badge.set_visible(item.selected)
+        if item.install_failed:
+            self.set_tooltip_text(_("Could not install {name}").format(name=label))
+        elif item.queued:
+            self.set_tooltip_text(_("{name} will be installed").format(name=label))
         else:
-            self.remove_css_class("selected")
-            self.check_badge.set_visible(False)
-
-    def set_loading(self, loading: bool) -> None:
-        """Set loading state."""
-        self.spinner.set_visible(loading)
-        if loading:
-            self.spinner.start()
-            self.add_css_class("dimmed")
-        else:
-            self.spinner.stop()
-            if self.installed:
-                self.remove_css_class("dimmed")
+            self.set_tooltip_text(label)
+
+        self.spinner.set_visible(item.loading)
+        self.spinner.set_spinning(item.loading)
+
+        text, details = item.plan
+        self.plan_label.set_label(text)
+        self.plan_label.set_visible(bool(text) and not item.installed)
+        self.plan_label.set_tooltip_text(details or None)
+
+        fraction, status = item.progress or (None, "")
+        self.progress_bar.set_visible(fraction is not None)
+        if fraction is not None:
+            self.progress_bar.set_fraction(min(max(fraction, 0.0), 1.0))
+        self.status_label.set_label(status)
+        self.status_label.set_visible(bool(status))
 
     def _on_click(self, _btn: Gtk.Button) -> None:
         """Handle click."""
-        self.on_select(self)
+        if self.item is not None:
+            self.on_select(self.item)
 
 
 class ProgressDots(Gtk.Box):
@@ -677,26 +714,49 @@ class ProgressDots(Gtk.Box):
 class WelcomeWindow(Adw.ApplicationWindow):
     """Main welcome window."""
 
-    def __init__(self, app: Adw.Application) -> None:
+    def __init__(self, app: Adw.Application, page: str | None = None) -> None:
         super().__init__(application=app)
         self.set_default_size(1000, 780)
         # Keep empty title for cleaner look
         self.set_title("")
 
-        self.pages_data = self._load_pages()
-        self.current_page = 0
-        self.page_widgets: list[Gtk.Widget] = []
-        self.browser_cards: list[BrowserCard] = []
+        self.state = StateStore()
+        with PROFILER.phase("load_pages"):
+            self.pages_data = self._load_pages()
+        # A page requested on the command line is the only one built up front.
+        # The tour always starts at the welcome page otherwise; the last page
+        # is kept in the state file, but only --page jumps ahead
+        self.current_page = (self.resolve_page(page) or 0) if page else 0
+        # One slot per stack page; content pages stay None until first needed
+        self.page_widgets: list[Gtk.Widget | None] = []
+        self._prefetch_id = 0
+        self.browser_items: list[BrowserItem] = []
+        self.browser_detector: BrowserDetector | None = None
+        self.browser_monitor: BrowserMonitor | None = None
+        self.default_browser = ""
+        # Cancelled on close so pending helper callbacks never touch a dead window
+        self.cancellable = Gio.Cancellable()
 
         self._build_ui()
+        self.connect("close-request", self._on_close_request)
+
+    def _on_close_request(self, _win: Gtk.Window) -> bool:
+        """Release watches and pending helpers before the window goes away."""
+        self.cancellable.cancel()
+        self.state.flush()
+        if self.browser_monitor:
+            self.browser_monitor.stop()
+            self.browser_monitor = None
+        return False
 
     def _load_pages(self) -> list | None:
-        """Load pages from YAML."""
-        try:
-            with open(os.path.join(APP_PATH, "pages.yaml"), encoding="utf-8") as f:
-                return yaml.safe_load(f)
-        except (FileNotFoundError, yaml.YAMLError):
-            return None
+        """Load pages from YAML (through the compiled cache)."""
+        pages = os.environ.get(PAGES_ENV)
+        if pages:
+            return load_pages(os.path.abspath(pages), APP_VERSION)
+        if resources.is_registered():
+            return load_pages(resources.BUNDLE, APP_VERSION, lambda: resources.read_bytes("pages.yaml"))
+        return load_pages(os.path.join(APP_PATH, "pages.yaml"), APP_VERSION)
 
     def _build_ui(self) -> None:
         """Build the UI."""
@@ -717,24 +777,93 @@ class WelcomeWindow(Adw.ApplicationWindow):
         main.append(self.stack)
 
         self._build_pages()
-        self._build_nav(main)
+        with PROFILER.phase("build_nav"):
+            self._build_nav(main)
+
+        # Only the first page exists so far; show it and warm up the next one
+        self._navigate()
 
     def _build_pages(self) -> None:
-        """Build all pages."""
-        # Welcome page
-        welcome = self._build_welcome()
-        self.stack.add_named(welcome, "welcome")
-        self.page_widgets.append(welcome)
-
-        # Content pages
-        if self.pages_data:
-            for i, data in enumerate(self.pages_data):
+        """Build the first page shown and reserve slots for the others."""
+        self.page_widgets = [None] * (1 + len(self.pages_data or []))
+        self._ensure_page(self.current_page)
+
+    def resolve_page(self, spec: str) -> int | None:
+        """Return the page index of a number or title given on the command line.
+
+        0 is the welcome page. Titles match untranslated or translated,
+        ignoring case, and ``page_type`` values such as "browsers" work too.
+        """
+        spec = spec.strip()
+        count = 1 + len(self.pages_data or [])
+        if spec.isdigit():
+            index = int(spec)
+            if index < count:
+                return index
+        else:
+            wanted = spec.casefold()
+            if wanted == "welcome":
+                return 0
+            for i, data in enumerate(self.pages_data or []):
+                title = data.get("title", "")
+                names = (title.casefold(), _(title).casefold(), data.get("page_type", "").casefold())
+                if wanted in names:
+                    return i + 1
+        print(f"Error: unknown page {spec!r}")
+        return None
+
+    def show_page(self, spec: str) -> None:
+        """Switch to the page named by ``spec``, building it if needed."""
+        index = self.resolve_page(spec)
+        if index is None or index == self.current_page:
+            return
+        if index > self.current_page:
+            self.stack.set_transition_type(Gtk.StackTransitionType.SLIDE_LEFT)
+        else:
+            self.stack.set_transition_type(Gtk.StackTransitionType.SLIDE_RIGHT)
+        self.current_page = index
+        self._navigate()
+
+    def _ensure_page(self, index: int) -> Gtk.Widget:
+        """Build the page at stack index ``index`` if it does not exist yet."""
+        page = self.page_widgets[index]
+        if page is not None:
+            return page
+
+        # Icons requested while building are decoded in page order
+        with LOADER.group(index):
+            if index == 0:
+                with PROFILER.phase("build_welcome"):
+                    page = self._build_welcome()
+                self.stack.add_named(page, "welcome")
+            else:
+                i = index - 1
+                data = self.pages_data[i]
                 if data.get("page_type") == "browsers":
-                    page = self._build_browser_page(data)
+                    with PROFILER.phase(f"build_browser_page:{i}"):
+                        page = self._build_browser_page(data)
                 else:
-                    page = self._build_action_page(data)
+                    with PROFILER.phase(f"build_action_page:{i}"):
+                        page = self._build_action_page(data)
                 self.stack.add_named(page, f"page_{i}")
-                self.page_widgets.append(page)
+
+        self.page_widgets[index] = page
+        return page
+
+    def _schedule_prefetch(self) -> None:
+        """Prebuild the page after the current one when the main loop is idle."""
+        if self._prefetch_id:
+            GLib.source_remove(self._prefetch_id)
+        self._prefetch_id = GLib.idle_add(
+            self._on_prefetch, self.current_page + 1, priority=GLib.PRIORITY_LOW
+        )
+
+    def _on_prefetch(self, index: int) -> bool:
+        """Idle callback building the next page ahead of navigation."""
+        self._prefetch_id = 0
+        if index < len(self.page_widgets):
+            self._ensure_page(index)
+        return GLib.SOURCE_REMOVE
 
     def _build_welcome(self) -> Gtk.Widget:
         """Build welcome page."""
@@ -752,16 +881,11 @@ class WelcomeWindow(Adw.ApplicationWindow):
 
         # Logo with animated glow effect
         logo_path = self._get_logo_path(os_info)
-        if logo_path and os.path.exists(logo_path):
-            try:
-                pb = GdkPixbuf.Pixbuf.new_from_file_at_size(logo_path, 130, 130)
-                logo = Gtk.Image.new_from_pixbuf(pb)
-            except GLib.Error:
-                logo = Gtk.Image.new_from_icon_name("distributor-logo")
+        if logo_path:
+            logo = texture_image(logo_path, 130, "distributor-logo")
         else:
-            logo = Gtk.Image.new_from_icon_name("distributor-logo")
+            logo = theme_image("distributor-logo", 130)
 
-        logo.set_pixel_size(130)
         logo.set_halign(Gtk.Align.CENTER)
         logo.set_valign(Gtk.Align.CENTER)
         logo.add_css_class("logo-image")
@@ -812,22 +936,10 @@ class WelcomeWindow(Adw.ApplicationWindow):
 
         return scroll
 
-    def _build_action_page(self, data: dict) -> Gtk.Widget:
-        """Build action page."""
-        scroll = Gtk.ScrolledWindow()
-        scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-
-        main = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=26)
-        main.set_margin_top(28)
-        main.set_margin_bottom(32)
-        main.set_margin_start(40)
-        main.set_margin_end(40)
-        scroll.set_child(main)
-
-        # Header
+    def _page_header(self, data: dict, max_width_chars: int) -> Gtk.Box:
+        """Build the title and subtitle shown above a page's cards."""
         header = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         header.set_halign(Gtk.Align.CENTER)
-        main.append(header)
 
         title = Gtk.Label(label=_(data.get("title", "")))
         title.add_css_class("page-title")
@@ -838,154 +950,376 @@ class WelcomeWindow(Adw.ApplicationWindow):
             sub = Gtk.Label(label=_(subtitle))
             sub.add_css_class("page-subtitle")
             sub.set_wrap(True)
-            sub.set_max_width_chars(60)
+            sub.set_max_width_chars(max_width_chars)
             sub.set_justify(Gtk.Justification.CENTER)
             header.append(sub)
+        return header
 
-        # Cards in manual rows for proper centering
-        actions = data.get("actions", [])
-        items_per_row = 4  # Max items per row
-        cards_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=14)
-        cards_container.set_halign(Gtk.Align.CENTER)
-        main.append(cards_container)
-
-        # Create rows
-        for i in range(0, len(actions), items_per_row):
-            row_actions = actions[i : i + items_per_row]
-            row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=14)
-            row.set_halign(Gtk.Align.CENTER)
-            cards_container.append(row)
-
-            for action in row_actions:
-                card = ActionCard(action)
-                row.append(card)
-
-        return scroll
-
-    def _build_browser_page(self, data: dict) -> Gtk.Widget:
-        """Build browser selection page."""
-        scroll = Gtk.ScrolledWindow()
-        scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-
+    def _card_page(self, data: dict, grid: Gtk.GridView, max_width_chars: int) -> Gtk.Box:
+        """Lay out a page: header on top, the scrolling card grid below."""
         main = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=26)
         main.set_margin_top(28)
         main.set_margin_bottom(32)
         main.set_margin_start(40)
         main.set_margin_end(40)
-        scroll.set_child(main)
+        main.append(self._page_header(data, max_width_chars))
 
-        # Header
-        header = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        header.set_halign(Gtk.Align.CENTER)
-        main.append(header)
-
-        title = Gtk.Label(label=_(data.get("title", "")))
-        title.add_css_class("page-title")
-        header.append(title)
+        # The grid must be the scrolled child to create only the visible cards
+        scroll = Gtk.ScrolledWindow()
+        scroll.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        scroll.set_vexpand(True)
+        scroll.set_child(grid)
+        main.append(scroll)
+        return main
 
-        subtitle = data.get("subtitle", "")
-        if subtitle:
-            sub = Gtk.Label(label=_(subtitle))
-            sub.add_css_class("page-subtitle")
-            sub.set_wrap(True)
-            sub.set_max_width_chars(55)
-            sub.set_justify(Gtk.Justification.CENTER)
-            header.append(sub)
+    def _build_action_page(self, data: dict) -> Gtk.Widget:
+        """Build action page."""
+        items = [ActionItem(action) for action in data.get("actions", [])]
+        grid = card_grid(
+            items,
+            lambda: ActionCard(
+                self._install_action_package,
+                lambda key: self.state.add_to_list(ACTIONS, "completed", key),
+            ),
+            ACTION_COLUMNS,
+            LOADER.current_group,
+        )
+        return self._card_page(data, grid, 60)
+
+    def _install_action_package(self, item: ActionItem) -> None:
+        """Install the package providing a missing action; its card rechecks it."""
+        item.set_installing(True)
+
+        def on_done(_result: procs.ProcessResult) -> None:
+            item.set_installing(False)
+
+        # browserInstall.py installs any repository package, not only browsers
+        self._run_browser_script(
+            ["install", f"repo:{item.action['package']}"],
+            on_done,
+            timeout=None,
+            kill_on_cancel=False,
+        )
 
-        # Browser cards in manual rows for proper centering
+    def _build_browser_page(self, data: dict) -> Gtk.Widget:
+        """Build browser selection page."""
         browsers = data.get("actions", [])
-        items_per_row = 5  # Max items per row
-        cards_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        cards_container.set_halign(Gtk.Align.CENTER)
-        main.append(cards_container)
-
-        self.browser_cards = []
-        # Create rows
-        for i in range(0, len(browsers), items_per_row):
-            row_browsers = browsers[i : i + items_per_row]
-            row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=16)
-            row.set_halign(Gtk.Align.CENTER)
-            cards_container.append(row)
-
-            for browser in row_browsers:
-                card = BrowserCard(browser, self._on_browser_select)
-                self.browser_cards.append(card)
-                row.append(card)
-
-        # Initial state check
-        GLib.idle_add(self.refresh_browser_states)
+        self.browser_detector = BrowserDetector(browsers)
+        snapshot = self.browser_detector.scan()
 
-        return scroll
+        self.browser_items = [
+            BrowserItem(browser, snapshot.get(browser.get("package", ""), NOT_INSTALLED)) for browser in browsers
+        ]
+        self.install_queue: list[BrowserItem] = []
+        grid = card_grid(
+            self.browser_items,
+            lambda: BrowserCard(self._on_browser_select),
+            BROWSER_COLUMNS,
+            LOADER.current_group,
+        )
+        grid.add_css_class("browser-grid")
+        main = self._card_page(data, grid, 55)
+
+        # Installs every queued browser in one transaction
+        self.install_button = Gtk.Button()
+        self.install_button.add_css_class("suggested-action")
+        self.install_button.add_css_class("install-button")
+        self.install_button.set_halign(Gtk.Align.CENTER)
+        self.install_button.set_visible(False)
+        self.install_button.connect("clicked", self._on_install_queued)
+        main.append(self.install_button)
+
+        # Initial state check, then follow changes made outside the app
+        GLib.idle_add(self.refresh_browser_states)
+        from pacman_db import PacmanDatabase
+
+        self.pacman_db = PacmanDatabase()
+        # Bumped by every planning run; results of older runs are dropped
+        self._plan_generation = 0
+        self._plan_installs()
+        self.browser_monitor = BrowserMonitor(
+            self.browser_detector, self._on_browser_installs_changed, self._on_default_browser_changed
+        )
+
+        return main
+
+    def _plan_installs(self) -> None:
+        """Estimate every browser install from the pacman databases in a thread."""
+        repo_packages = []
+        for item in self.browser_items:
+            install = item.browser.get("install")
+            if not install:
+                continue
+            if install.get("source", "repo") == "aur":
+                item.set_plan(_("AUR"), _("Built from the AUR; the download size is not known in advance"))
+            else:
+                repo_packages.append(install.get("name", ""))
+
+        self._plan_generation += 1
+        generation = self._plan_generation
+
+        def worker() -> None:
+            plans = self.pacman_db.plan_many(repo_packages)
+            GLib.idle_add(self._show_install_plans, plans, generation)
+
+        threading.Thread(target=worker, name="install-planner", daemon=True).start()
+
+    def _show_install_plans(self, plans: dict[str, InstallPlan], generation: int) -> bool:
+        """Show the download estimate of each planned browser on its card."""
+        if generation != self._plan_generation:
+            # A later run planned against newer databases
+            return GLib.SOURCE_REMOVE
+        for item in self.browser_items:
+            plan = plans.get(item.browser.get("install", {}).get("name", ""))
+            if plan is None or not plan.found:
+                continue
+            size = GLib.format_size(plan.download_size)
+            details = gettext.ngettext(
+                "Downloads {size} in {count} package and uses {disk} on disk",
+                "Downloads {size} in {count} packages and uses {disk} on disk",
+                len(plan.added),
+            ).format(size=size, count=len(plan.added), disk=GLib.format_size(plan.installed_size))
+            text = size
+            # browserInstall.py always runs pacman -Su, so the upgrade is downloaded too
+            if plan.upgrade_size > 0:
+                upgrade = GLib.format_size(plan.upgrade_size)
+                text = _("{size} + {upgrade} system update").format(size=size, upgrade=upgrade)
+                details += "\n" + _("The system is updated first, which downloads {size} more").format(size=upgrade)
+                if plan.partial_upgrade:
+                    details += "\n" + _("Installed packages it depends on are out of date")
+            item.set_plan(text, details)
+        return GLib.SOURCE_REMOVE
 
-    def _run_browser_script(self, args: list[str]) -> str:
-        """Helper to run the browser script and return its output."""
+    def _run_browser_script(
+        self,
+        args: list[str],
+        callback=None,
+        timeout: float | None = procs.HELPER_TIMEOUT,
+        kill_on_cancel: bool = True,
+    ) -> None:
+        """Helper to run the browser script; ``callback`` gets its result."""
         script_path = os.path.join(APP_PATH, "scripts", "browser.sh")
+
+        def on_done(result: procs.ProcessResult) -> None:
+            if not result.ok:
+                reason = "timed out" if result.timed_out else result.error or f"exit status {result.status}"
+                print(f"Error running browser script {args}: {reason}")
+            if callback:
+                callback(result)
+
+        procs.run_async(
+            [script_path] + args,
+            on_done,
+            timeout=timeout,
+            cancellable=self.cancellable,
+            kill_on_cancel=kill_on_cancel,
+        )
+
+    def _update_default_browser(self) -> None:
+        """Read the default browser, falling back to browser.sh if unresolved."""
+        desktop = mimeapps.get_default_browser()
+        if desktop:
+            self._show_default_browser(desktop)
+        else:
+            self._run_browser_script(
+                ["getBrowser"], lambda result: self._show_default_browser(result.stdout.strip())
+            )
+
+    def _show_default_browser(self, desktop: str) -> None:
+        """Move the selection badge to the default browser."""
+        self.default_browser = desktop
+        for item in self.browser_items:
+            item.set_selected(item.installed and item.detected_desktop == self.default_browser)
+
+    def _set_default_browser(self, desktop: str) -> None:
+        """Write the default browser, falling back to browser.sh on errors."""
         try:
-            cmd = [script_path] + args
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError, OSError) as e:
-            print(f"Error running browser script {args}: {e}")
-            return ""
+            mimeapps.set_default_browser(desktop)
+        except OSError as e:
+            print(f"Error setting default browser natively: {e}")
+            self._run_browser_script(["setBrowser", desktop], lambda _result: self._update_default_browser())
+            return
+        self._update_default_browser()
 
     def refresh_browser_states(self) -> bool:
         """Update all browser cards to reflect current system state."""
-        current_browser_default = self._run_browser_script(["getBrowser"])
-
-        for card in self.browser_cards:
-            is_installed = False
-            installed_desktop = None
-
-            # Check each variant
-            for variant in card.browser.get("variants", []):
-                check_path = variant.get("check", "")
-                if check_path and os.path.exists(check_path):
-                    is_installed = True
-                    installed_desktop = variant.get("desktop", "")
-                    break
+        snapshot = self.browser_detector.scan()
 
-            card.set_installed(is_installed)
-            card.detected_desktop = installed_desktop
-            card.set_selected(is_installed and installed_desktop == current_browser_default)
+        for item in self.browser_items:
+            self._apply_browser_state(item, snapshot.get(item.browser.get("package", ""), NOT_INSTALLED))
+        self._update_default_browser()
 
         return GLib.SOURCE_REMOVE
 
-    def _on_browser_select(self, selected_card: BrowserCard) -> None:
-        """Handle browser selection."""
-        # Start the action in a background thread to keep UI responsive
-        thread = threading.Thread(target=self._perform_browser_action, args=(selected_card,))
-        thread.daemon = True
-        thread.start()
-
-    def _perform_browser_action(self, selected_card: BrowserCard) -> None:
-        """Perform browser installation and set as default."""
-        browser = selected_card.browser
-        GLib.idle_add(selected_card.set_loading, True)
+    def _apply_browser_state(self, item: BrowserItem, state: BrowserState) -> None:
+        """Record a detected state on one browser."""
+        item.set_installed(state.installed, state.desktop)
+        item.set_selected(state.installed and state.desktop == self.default_browser)
+
+    def _on_browser_installs_changed(self, changed: dict[str, BrowserState]) -> None:
+        """Update only the cards whose browser was installed or removed."""
+        for item in self.browser_items:
+            state = changed.get(item.browser.get("package", ""))
+            if state is not None:
+                self._apply_browser_state(item, state)
+
+    def _on_default_browser_changed(self) -> None:
+        """Re-read the default browser and move the selection badge."""
+        self._update_default_browser()
+
+    def _on_browser_select(self, selected_item: BrowserItem) -> None:
+        """Set an installed browser as default, or toggle it in the install queue."""
+        if selected_item.loading:
+            return
+
+        if self.browser_detector.state(selected_item.browser).installed:
+            selected_item.set_loading(True)
+            self._make_default_browser(selected_item)
+            return
+
+        if not selected_item.browser.get("install"):
+            return
+        if selected_item.queued:
+            self.install_queue.remove(selected_item)
+        else:
+            self.install_queue.append(selected_item)
+        selected_item.set_queued(not selected_item.queued)
+        self._update_install_button()
+
+    def _update_install_button(self) -> None:
+        """Show how many browsers are queued for installation."""
+        count = len(self.install_queue)
+        self.install_button.set_visible(count > 0)
+        self.install_button.set_label(
+            gettext.ngettext("Install {count} browser", "Install {count} browsers", count).format(count=count)
+        )
+
+    def _on_install_queued(self, _btn: Gtk.Button) -> None:
+        """Install every queued browser with one authentication and one transaction."""
+        items, self.install_queue = self.install_queue, []
+        if not items:
+            return
+        self._update_install_button()
+
+        targets = []
+        for item in items:
+            install = item.browser["install"]
+            targets.append(f"{install.get('source', 'repo')}:{install.get('name', '')}")
+            item.set_queued(False)
+            item.set_loading(True)
+
+        for item in items:
+            item.show_progress(None, _("Waiting for authorization…"))
+
+        # Progress arrives as JSON lines (see browserInstall.py); never kill it midway
+        progress = {"succeeded": set(), "started": None, "started_bytes": 0}
+        script_path = os.path.join(APP_PATH, "scripts", "browser.sh")
+        procs.stream_lines(
+            [script_path, "install", *targets],
+            lambda line: self._on_install_event(items, line, progress),
+            lambda result: self._on_browsers_installed(items, result, progress["succeeded"]),
+            timeout=None,
+            cancellable=self.cancellable,
+            kill_on_cancel=False,
+        )
+
+    def _on_install_event(self, items: list[BrowserItem], line: str, progress: dict) -> None:
+        """Show one progress event of the install script on the affected cards."""
+        import json
 
         try:
-            # Check if it's already installed
-            is_installed = any(os.path.exists(v.get("check", "")) for v in browser.get("variants", []))
-
-            if not is_installed:
-                # Run the install script (via pkexec in browser.sh)
-                self._run_browser_script(["install", browser.get("package", "")])
-
-            # After (potential) installation, find the desktop file again
-            desktop_to_set = None
-            for variant in browser.get("variants", []):
-                check_path = variant.get("check", "")
-                if check_path and os.path.exists(check_path):
-                    desktop_to_set = variant.get("desktop", "")
-                    break
-
-            # Set as default browser if we have a desktop file
-            if desktop_to_set:
-                self._run_browser_script(["setBrowser", desktop_to_set])
-                print(f"Set default browser to: {browser.get('label')} ({desktop_to_set})")
-
-        finally:
-            GLib.idle_add(selected_card.set_loading, False)
-            GLib.idle_add(self.refresh_browser_states)
+            event = json.loads(line)
+        except ValueError:
+            return
+        if not isinstance(event, dict):
+            return
+
+        phase = event.get("phase")
+        package = event.get("package")
+        by_package = {item.browser["install"].get("name"): item for item in items}
+
+        if phase == "sync":
+            for item in items:
+                item.show_progress(None, _("Synchronizing…"))
+        elif phase == "download":
+            # The bytes cover the whole transaction, dependencies and system
+            # update included; each card's bar follows its own package file
+            done, total = event.get("bytes", 0), event.get("total", 0)
+            eta = self._install_eta(progress, done, total)
+            files = event.get("packages") or {}
+            for name, item in by_package.items():
+                if item.browser["install"].get("source", "repo") != "repo":
+                    continue
+                got, size = files.get(name, (0, 0))
+                if size and got < size:
+                    fraction = got / size
+                    text = f"{GLib.format_size(got)} / {GLib.format_size(size)}"
+                else:
+                    # Downloaded or cached already; the rest of the transaction is not
+                    fraction = None
+                    text = _("Waiting for other downloads…")
+                item.show_progress(fraction, f"{text} · {eta}" if eta else text)
+        elif phase == "install":
+            percent = event.get("percent")
+            fraction = percent / 100 if percent is not None else None
+            for item in items:
+                if item.browser["install"].get("source", "repo") == "repo":
+                    item.show_progress(fraction, _("Installing…"))
+        elif phase == "aur" and package in by_package:
+            # AUR packages are built one after the other
+            by_package[package].show_progress(None, _("Building…"))
+        elif phase == "result" and package in by_package:
+            if event.get("ok"):
+                progress["succeeded"].add(package)
+            by_package[package].show_progress(None, _("Done") if event.get("ok") else _("Failed"))
+
+    def _install_eta(self, progress: dict, done: int, total: int) -> str:
+        """Estimate the remaining download time from the average rate."""
+        now = time.monotonic()
+        if progress["started"] is None:
+            progress["started"], progress["started_bytes"] = now, done
+            return ""
+        elapsed = now - progress["started"]
+        rate = (done - progress["started_bytes"]) / elapsed if elapsed > 0 else 0
+        if rate <= 0 or done >= total:
+            return ""
+        seconds = int((total - done) / rate)
+        if seconds >= 60:
+            return _("{minutes} min left").format(minutes=math.ceil(seconds / 60))
+        return _("{seconds} s left").format(seconds=max(seconds, 1))
+
+    def _on_browsers_installed(
+        self, items: list[BrowserItem], result: procs.ProcessResult, succeeded: set[str]
+    ) -> None:
+        """Map the per-package results back to their cards."""
+        if not result.ok:
+            reason = "timed out" if result.timed_out else result.error or f"exit status {result.status}"
+            print(f"Error installing browsers: {reason}")
+
+        # Rescan so everyone sees the result of the installation
+        self.refresh_browser_states()
+        self._plan_installs()
+        for item in items:
+            item.set_loading(False)
+            item.set_install_failed(item.browser["install"].get("name") not in succeeded)
+
+        # A single queued browser was clearly meant to become the default
+        if len(items) == 1 and not items[0].install_failed:
+            items[0].set_loading(True)
+            self._make_default_browser(items[0])
+
+    def _make_default_browser(self, item: BrowserItem) -> None:
+        """Set the browser's detected desktop file as default and end loading."""
+        browser = item.browser
+        desktop_to_set = self.browser_detector.state(browser).desktop
+
+        # Set as default browser if we have a desktop file
+        if desktop_to_set:
+            self._set_default_browser(desktop_to_set)
+            self.state.set_string(BROWSERS, "chosen", browser.get("package", ""))
+            print(f"Set default browser to: {browser.get('label')} ({desktop_to_set})")
+
+        item.set_loading(False)
 
     def _build_nav(self, parent: Gtk.Box) -> None:
         """Build navigation bar."""
@@ -996,7 +1330,7 @@ class WelcomeWindow(Adw.ApplicationWindow):
         # Startup checkbox
         self.startup_check = Gtk.CheckButton(label=_("Show on startup"))
         self.startup_check.add_css_class("startup-check")
-        self.startup_check.set_active(self._is_startup_enabled())
+        self.startup_check.set_active(self.state.startup_enabled())
         self.startup_check.connect("toggled", self._on_startup_toggled)
         bar.set_start_widget(self.startup_check)
 
@@ -1062,87 +1396,28 @@ class WelcomeWindow(Adw.ApplicationWindow):
             self.stack.set_transition_type(Gtk.StackTransitionType.SLIDE_LEFT)
             self._navigate()
         else:
+            # Finishing the tour means the window is no longer needed at login
+            self.state.set_boolean(SETUP, "completed", True)
+            self.state.set_integer(WINDOW, "last-page", 0)
             self.close()
 
     def _navigate(self) -> None:
         """Navigate to current page."""
+        LOADER.set_visible_group(self.current_page)
+        self._ensure_page(self.current_page)
         if self.current_page == 0:
             self.stack.set_visible_child_name("welcome")
         else:
             self.stack.set_visible_child_name(f"page_{self.current_page - 1}")
 
         self.progress.set_page(self.current_page)
+        self.state.set_integer(WINDOW, "last-page", self.current_page)
         self._update_nav()
-
-    def _is_startup_enabled(self) -> bool:
-        """Check if autostart is enabled."""
-        autostart_file = os.path.expanduser("~/.config/autostart/org.biglinux.welcome.desktop")
-        if not os.path.exists(autostart_file):
-            return True
-
-        try:
-            with open(autostart_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                return "Hidden=true" not in content
-        except OSError:
-            return True
+        self._schedule_prefetch()
 
     def _on_startup_toggled(self, btn: Gtk.CheckButton) -> None:
-        """Toggle autostart."""
-        active = btn.get_active()
-        autostart_dir = os.path.expanduser("~/.config/autostart")
-        autostart_file = os.path.join(autostart_dir, "org.biglinux.welcome.desktop")
-        system_file = "/etc/xdg/autostart/org.biglinux.welcome.desktop"
-        if not os.path.exists(system_file):
-            # Fallback for development/non-standard install
-            system_file = os.path.abspath(os.path.join(APP_PATH, "../../../applications/org.biglinux.welcome.desktop"))
-
-        try:
-            if not os.path.exists(autostart_dir):
-                os.makedirs(autostart_dir, exist_ok=True)
-
-            if active:
-                if os.path.exists(autostart_file):
-                    # Remove Hidden=true if it exists
-                    with open(autostart_file, "r", encoding="utf-8") as f:
-                        lines = f.readlines()
-                    with open(autostart_file, "w", encoding="utf-8") as f:
-                        for line in lines:
-                            if not line.startswith("Hidden="):
-                                f.write(line)
-                # If file doesn't exist, we don't need to do anything because the default
-                # behavior should be to run the system-wide desktop file if no local one exists
-                # BUT, since we want to be sure it's in the autostart dir for KDE to pick it up
-                # if it's not already there by some other means.
-                # Actually, standard autostart looks in /etc/xdg/autostart too.
-                # If we want to GUARANTEE it shows up in the "Autostart" settings of KDE,
-                # having it in ~/.config/autostart is best.
-                else:
-                    if os.path.exists(system_file):
-                        shutil.copy2(system_file, autostart_file)
-            else:
-                # Disable startup
-                if not os.path.exists(autostart_file):
-                    if os.path.exists(system_file):
-                        shutil.copy2(system_file, autostart_file)
-
-                # Ensure Hidden=true is present
-                if os.path.exists(autostart_file):
-                    with open(autostart_file, "r", encoding="utf-8") as f:
-                        lines = f.readlines()
-
-                    hidden_exists = False
-                    with open(autostart_file, "w", encoding="utf-8") as f:
-                        for line in lines:
-                            if line.startswith("Hidden="):
-                                f.write("Hidden=true\n")
-                                hidden_exists = True
-                            else:
-                                f.write(line)
-                        if not hidden_exists:
-                            f.write("Hidden=true\n")
-        except OSError as e:
-            print(f"Error toggling autostart: {e}")
+        """Toggle autostart; the store saves it in the background."""
+        self.state.set_startup_enabled(btn.get_active())
 
     def _parse_os_release(self) -> dict:
         """Parse OS info."""
@@ -1174,19 +1449,45 @@ class BigLinuxWelcomeApp(Adw.Application):
     """Main application."""
 
     def __init__(self) -> None:
-        super().__init__(application_id="org.biglinux.welcome")
+        # A second invocation hands its command line to the running instance over D-Bus
+        super().__init__(
+            application_id="org.biglinux.welcome",
+            flags=Gio.ApplicationFlags.HANDLES_COMMAND_LINE,
+        )
+        self.win: WelcomeWindow | None = None
+
+        self.add_main_option(
+            "page",
+            ord("p"),
+            GLib.OptionFlags.NONE,
+            GLib.OptionArg.STRING,
+            _("Open the given page, by number (0 is the welcome page) or title"),
+            _("PAGE"),
+        )
+
+        self.connect("startup", self._on_startup)
+        self.connect("activate", self._on_activate)
+        self.connect("command-line", self._on_command_line)
+
+    def _on_startup(self, _app: Adw.Application) -> None:
+        """Set up assets and styling; runs only in the primary instance."""
+        with PROFILER.phase("register_resources"):
+            resources.register()
 
         # Set color scheme management
         style_manager = Adw.StyleManager.get_default()
         style_manager.set_color_scheme(Adw.ColorScheme.DEFAULT)
 
-        self.connect("activate", self._on_activate)
-        self._load_css()
+        with PROFILER.phase("load_css"):
+            self._load_css()
 
     def _load_css(self) -> None:
-        """Load CSS."""
+        """Load style.css from the resource bundle or the app directory."""
         css = Gtk.CssProvider()
-        css.load_from_data(PREMIUM_CSS.encode())
+        if resources.is_registered():
+            css.load_from_resource(resources.resource_path("style.css"))
+        else:
+            css.load_from_path(os.path.join(APP_PATH, "style.css"))
         display = Gdk.Display.get_default()
         if display:
             Gtk.StyleContext.add_provider_for_display(
@@ -1195,14 +1496,45 @@ class BigLinuxWelcomeApp(Adw.Application):
 
     def _on_activate(self, _app: Adw.Application) -> None:
         """Activate app."""
-        self.win = WelcomeWindow(self)
+        self._present()
+
+    def _on_command_line(self, _app: Adw.Application, command_line: Gio.ApplicationCommandLine) -> int:
+        """Handle the options of this or a forwarded invocation."""
+        options = command_line.get_options_dict().end().unpack()
+        self._present(options.get("page"))
+        return 0
+
+    def _present(self, page: str | None = None) -> None:
+        """Show the window, creating it on first use, at ``page`` if given."""
+        if self.win is not None:
+            if page:
+                self.win.show_page(page)
+            self.win.present()
+            return
+
+        with PROFILER.phase("build_window"):
+            self.win = WelcomeWindow(self, page)
         self.win.present()
 
+        if PROFILER.enabled:
+            clock = self.win.get_frame_clock()
+            if clock:
+                self._paint_handler = clock.connect("after-paint", self._on_first_frame)
+            else:
+                PROFILER.write()
+
+    def _on_first_frame(self, clock: Gdk.FrameClock) -> None:
+        """Record the first presented frame and write the profile."""
+        clock.disconnect(self._paint_handler)
+        PROFILER.mark("first_frame")
+        PROFILER.write()
+
 
 def main() -> None:
     """Entry point."""
+    setup_locale()
     app = BigLinuxWelcomeApp()
-    app.run()
+    app.run(sys.argv)
 
 
 if __name__ == "__main__":
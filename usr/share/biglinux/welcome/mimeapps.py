@@ -0,0 +1,213 @@
+"""Default web browser backend following the XDG MIME applications spec.
+
+Reads and writes the ``x-scheme-handler/http``, ``x-scheme-handler/https``
+and ``text/html`` associations directly instead of going through
+``xdg-settings``/``xdg-mime``. The ``mimeapps.list`` files are looked up in
+spec order, desktop-specific files (``kde-mimeapps.list``...) first in each
+directory. Parsed files are cached by mtime and size, and writes replace
+the file atomically.
+"""
+
+from __future__ import annotations
+
+import os
+
+from xdg import application_dirs, config_dirs, config_home, current_desktops, mimeapps_dirs
+
+BROWSER_MIME_TYPES = ("x-scheme-handler/http", "x-scheme-handler/https", "text/html")
+DEFAULT_GROUP = "Default Applications"
+
+# path -> (mtime_ns, size, {group: {key: value}})
+_parsed: dict[str, tuple[int, int, dict[str, dict[str, str]]]] = {}
+
+
+def parse_keyfile(path: str) -> dict[str, dict[str, str]] | None:
+    """Parse a desktop-style key file, reusing the cached result if unchanged.
+
+    Returns None when the file does not exist or cannot be read.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        _parsed.pop(path, None)
+        return None
+
+    cached = _parsed.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    groups: dict[str, dict[str, str]] = {}
+    current: dict[str, str] | None = None
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for raw in f:
+                line = raw.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith("[") and line.endswith("]"):
+                    current = groups.setdefault(line[1:-1], {})
+                elif current is not None and "=" in line:
+                    key, value = line.split("=", 1)
+                    current.setdefault(key.strip(), value.strip())
+    except OSError:
+        return None
+
+    _parsed[path] = (st.st_mtime_ns, st.st_size, groups)
+    return groups
+
+
+def mimeapps_files() -> list[str]:
+    """All candidate mimeapps.list paths, highest precedence first."""
+    files = []
+    for directory in mimeapps_dirs():
+        files += [os.path.join(directory, f"{d}-mimeapps.list") for d in current_desktops()]
+        files.append(os.path.join(directory, "mimeapps.list"))
+    return files
+
+
+def is_installed(desktop_id: str) -> bool:
+    return any(os.path.exists(os.path.join(d, desktop_id)) for d in application_dirs())
+
+
+def _split_list(value: str) -> list[str]:
+    return [item for item in value.split(";") if item]
+
+
+def query_default(mime_type: str) -> str | None:
+    """Return the default handler of ``mime_type`` or None if there is none."""
+    for path in mimeapps_files():
+        groups = parse_keyfile(path)
+        if not groups:
+            continue
+        for desktop_id in _split_list(groups.get(DEFAULT_GROUP, {}).get(mime_type, "")):
+            if is_installed(desktop_id):
+                return desktop_id
+
+    # Legacy defaults.list shipped by distributions
+    for directory in application_dirs():
+        groups = parse_keyfile(os.path.join(directory, "defaults.list"))
+        if not groups:
+            continue
+        for desktop_id in _split_list(groups.get(DEFAULT_GROUP, {}).get(mime_type, "")):
+            if is_installed(desktop_id):
+                return desktop_id
+    return None
+
+
+def _is_kde() -> bool:
+    return "kde" in current_desktops()
+
+
+def _kde_browser() -> str | None:
+    """Return the BrowserApplication that Plasma (and xdg-settings) prefer."""
+    for directory in [config_home()] + config_dirs():
+        groups = parse_keyfile(os.path.join(directory, "kdeglobals"))
+        if groups is None:
+            continue
+        value = groups.get("General", {}).get("BrowserApplication", "")
+        # A leading "!" marks a command line rather than a desktop file
+        if value and not value.startswith("!"):
+            return value if value.endswith(".desktop") else f"{value}.desktop"
+        if value:
+            return None
+    return None
+
+
+def get_default_browser() -> str | None:
+    """Return the desktop id of the default web browser, as xdg-settings does."""
+    if _is_kde():
+        browser = _kde_browser()
+        if browser:
+            return browser
+    return query_default("x-scheme-handler/http")
+
+
+def _update_keyfile(path: str, group: str, values: dict[str, str], only_existing: bool = False) -> None:
+    """Set ``values`` in ``group`` of ``path`` and replace the file atomically.
+
+    Unrelated lines are kept verbatim. With ``only_existing``, keys that
+    are not already in the file are left out.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        lines = []
+
+    pending = dict(values)
+    output: list[str] = []
+    in_group = False
+    group_seen = False
+
+    def flush_pending() -> None:
+        if not only_existing:
+            output.extend(f"{k}={v}" for k, v in pending.items())
+        pending.clear()
+
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("[") and stripped.endswith("]"):
+            if in_group:
+                # Insert missing keys before the blank lines ending the group
+                trailing = []
+                while output and not output[-1].strip():
+                    trailing.append(output.pop())
+                flush_pending()
+                output.extend(trailing)
+            in_group = stripped[1:-1] == group
+            group_seen = group_seen or in_group
+        elif in_group and "=" in stripped:
+            key = stripped.split("=", 1)[0].strip()
+            if key in values:
+                if key in pending:
+                    output.append(f"{key}={pending.pop(key)}")
+                continue
+        output.append(line)
+
+    if in_group:
+        flush_pending()
+    elif pending and not only_existing:
+        if output and output[-1].strip():
+            output.append("")
+        output.append(f"[{group}]")
+        flush_pending()
+
+    if output == lines:
+        return
+
+    import tempfile
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("\n".join(output) + "\n")
+        if os.path.exists(path):
+            os.chmod(tmp, os.stat(path).st_mode & 0o7777)
+        else:
+            os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def set_default_browser(desktop_id: str) -> None:
+    """Make ``desktop_id`` the handler for web links and HTML files.
+
+    Raises OSError when a file cannot be written.
+    """
+    values = {mime: desktop_id for mime in BROWSER_MIME_TYPES}
+    home = config_home()
+    _update_keyfile(os.path.join(home, "mimeapps.list"), DEFAULT_GROUP, values)
+
+    # Desktop-specific user files take precedence; fix conflicting entries there
+    for desktop in current_desktops():
+        path = os.path.join(home, f"{desktop}-mimeapps.list")
+        if os.path.exists(path):
+            _update_keyfile(path, DEFAULT_GROUP, values, only_existing=True)
+
+    # xdg-settings also records the browser for Plasma
+    if _is_kde():
+        _update_keyfile(os.path.join(home, "kdeglobals"), "General", {"BrowserApplication": desktop_id})
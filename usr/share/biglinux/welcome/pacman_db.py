@@ -0,0 +1,374 @@
+"""Install planning from the local pacman databases.
+
+Reads the sync databases (``/var/lib/pacman/sync/*.db``) and the local
+database in-process, so estimating an install does not spawn pacman. For a
+package it computes the packages that would be added (the dependency
+closure, resolved by name and then by ``provides``), their download and
+installed sizes, and whether installed dependencies are older than in the
+sync databases, in which case installing without a system upgrade would be
+a partial upgrade. Versions are ordered like pacman's vercmp.
+
+Parsed databases are cached in memory and in a marshal file under the user
+cache directory, keyed by the path, mtime and size of every database, so
+the archives are only read again after a sync. All paths are relative to a
+``root`` so the planner can run against a fixture tree.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import re
+import threading
+from typing import NamedTuple
+
+from xdg import cache_home
+
+# Bump when the layout of the cache file changes
+CACHE_FORMAT = 1
+
+# Version constraint or description after a dependency name
+_DEP_SPLIT = re.compile(r"[<>=:]")
+
+# Fields kept per package: version, depends, provides, download size, installed size
+Package = tuple[str, tuple[str, ...], tuple[str, ...], int, int]
+
+
+class InstallPlan(NamedTuple):
+    """What installing one package would do to the system."""
+
+    package: str
+    found: bool  # False when no sync database has the package
+    added: tuple[str, ...]  # the package and its missing dependencies
+    download_size: int
+    installed_size: int
+    outdated: tuple[str, ...]  # installed dependencies older than the sync db
+    upgrade_size: int  # download size of the full system upgrade
+    unresolved: tuple[str, ...]
+
+    @property
+    def partial_upgrade(self) -> bool:
+        """Whether the install needs a system upgrade to stay consistent."""
+        return bool(self.outdated)
+
+
+def _dep_name(dep: str) -> str:
+    return _DEP_SPLIT.split(dep, 1)[0].strip()
+
+
+def _split_evr(version: str) -> tuple[str, str, str | None]:
+    """Split ``epoch:pkgver-pkgrel`` into its parts; the epoch defaults to 0."""
+    digits = len(version) - len(version.lstrip("0123456789"))
+    epoch, rest = "0", version
+    if version[digits : digits + 1] == ":":
+        epoch, rest = version[:digits] or "0", version[digits + 1 :]
+    pkgver, sep, pkgrel = rest.rpartition("-")
+    if not sep:
+        return epoch, rest, None
+    return epoch, pkgver, pkgrel
+
+
+def _rpmvercmp(a: str, b: str) -> int:
+    """Compare two version strings segment by segment, as libalpm does."""
+    if a == b:
+        return 0
+    one = two = 0
+    while one < len(a) and two < len(b):
+        start1, start2 = one, two
+        while one < len(a) and not a[one].isalnum():
+            one += 1
+        while two < len(b) and not b[two].isalnum():
+            two += 1
+        if one >= len(a) or two >= len(b):
+            break
+        # A longer run of separators is newer, e.g. 1..0 > 1.0
+        if one - start1 != two - start2:
+            return -1 if one - start1 < two - start2 else 1
+
+        numeric = a[one].isdigit()
+        same_kind = str.isdigit if numeric else str.isalpha
+        end1, end2 = one, two
+        while end1 < len(a) and same_kind(a[end1]):
+            end1 += 1
+        while end2 < len(b) and same_kind(b[end2]):
+            end2 += 1
+        seg1, seg2 = a[one:end1], b[two:end2]
+        if not seg2:
+            # A number against letters: the number is newer
+            return 1 if numeric else -1
+        if numeric:
+            seg1, seg2 = seg1.lstrip("0"), seg2.lstrip("0")
+            if len(seg1) != len(seg2):
+                return 1 if len(seg1) > len(seg2) else -1
+        if seg1 != seg2:
+            return 1 if seg1 > seg2 else -1
+        one, two = end1, end2
+
+    if one >= len(a) and two >= len(b):
+        return 0
+    # "1.0" < "1.0.1" but "1.0alpha" < "1.0"
+    if (one >= len(a) and not b[two].isalpha()) or (one < len(a) and a[one].isalpha()):
+        return -1
+    return 1
+
+
+def vercmp(a: str, b: str) -> int:
+    """Return -1, 0 or 1 as pacman version ``a`` is older, equal or newer."""
+    if a == b:
+        return 0
+    epoch1, ver1, rel1 = _split_evr(a)
+    epoch2, ver2, rel2 = _split_evr(b)
+    result = _rpmvercmp(epoch1, epoch2) or _rpmvercmp(ver1, ver2)
+    if result == 0 and rel1 is not None and rel2 is not None:
+        result = _rpmvercmp(rel1, rel2)
+    return result
+
+
+def parse_desc(text: str) -> dict[str, list[str]]:
+    """Parse a ``desc`` file into {"%FIELD%": [values]}."""
+    fields: dict[str, list[str]] = {}
+    current: list[str] | None = None
+    for line in text.splitlines():
+        if line.startswith("%") and line.endswith("%"):
+            current = fields.setdefault(line, [])
+        elif not line:
+            current = None
+        elif current is not None:
+            current.append(line)
+    return fields
+
+
+def _package(fields: dict[str, list[str]], size_field: str) -> tuple[str, Package] | None:
+    name = fields.get("%NAME%")
+    version = fields.get("%VERSION%")
+    if not name or not version:
+        return None
+
+    def size(field: str) -> int:
+        value = fields.get(field, ["0"])[0]
+        return int(value) if value.isdigit() else 0
+
+    return name[0], (
+        version[0],
+        tuple(fields.get("%DEPENDS%", ())),
+        tuple(_dep_name(p) for p in fields.get("%PROVIDES%", ())),
+        size("%CSIZE%"),
+        size(size_field),
+    )
+
+
+def read_sync_db(path: str) -> dict[str, Package]:
+    """Read one sync database archive; unsupported compressions read as empty."""
+    import tarfile
+
+    packages: dict[str, Package] = {}
+    try:
+        with tarfile.open(path, "r:*") as tar:
+            for member in tar:
+                if not member.isfile() or not member.name.endswith("/desc"):
+                    continue
+                f = tar.extractfile(member)
+                if f is None:
+                    continue
+                entry = _package(parse_desc(f.read().decode("utf-8", "replace")), "%ISIZE%")
+                if entry:
+                    packages[entry[0]] = entry[1]
+    except (OSError, tarfile.TarError, EOFError) as e:
+        # zstd-compressed databases need a Python with zstd support in tarfile
+        print(f"Error reading {path}: {e}")
+    return packages
+
+
+def read_local_db(directory: str) -> dict[str, Package]:
+    """Read the installed packages from the local database directory."""
+    packages: dict[str, Package] = {}
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return packages
+    with entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            try:
+                with open(os.path.join(entry.path, "desc"), encoding="utf-8", errors="replace") as f:
+                    parsed = _package(parse_desc(f.read()), "%SIZE%")
+            except OSError:
+                continue
+            if parsed:
+                packages[parsed[0]] = parsed[1]
+    return packages
+
+
+class PacmanDatabase:
+    """The sync and local databases below ``root``, parsed on demand."""
+
+    def __init__(self, root: str = "/") -> None:
+        self.root = root
+        self.db_path = os.path.join(root, "var/lib/pacman")
+        # Guards the tables below; plan() holds it across load() and the reads
+        self._lock = threading.RLock()
+        self._key: tuple | None = None
+        self._repos: list[dict[str, Package]] = []
+        self._local: dict[str, Package] = {}
+        self._providers: dict[str, str] = {}
+        self._local_provides: set[str] = set()
+        self._upgrade_size = 0
+
+    def _repo_order(self) -> list[str]:
+        """Repository names in pacman.conf order, then any other database."""
+        order = []
+        try:
+            with open(os.path.join(self.root, "etc/pacman.conf"), encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line.startswith("[") and line.endswith("]") and line != "[options]":
+                        order.append(line[1:-1])
+        except OSError:
+            pass
+        sync = os.path.join(self.db_path, "sync")
+        try:
+            present = sorted(name[:-3] for name in os.listdir(sync) if name.endswith(".db"))
+        except OSError:
+            present = []
+        return [r for r in order if r in present] + [r for r in present if r not in order]
+
+    def _sources(self) -> list[str]:
+        sync = os.path.join(self.db_path, "sync")
+        return [os.path.join(sync, f"{repo}.db") for repo in self._repo_order()] + [
+            os.path.join(self.db_path, "local")
+        ]
+
+    def _current_key(self, sources: list[str]) -> tuple:
+        key = [CACHE_FORMAT]
+        for path in sources:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            key.append((path, st.st_mtime_ns, st.st_size))
+        return tuple(key)
+
+    def _cache_path(self) -> str:
+        digest = hashlib.sha1(self.root.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(cache_home(), "biglinux-welcome", f"pacman-{digest}.marshal")
+
+    def _read_cache(self, key: tuple) -> tuple | None:
+        try:
+            with open(self._cache_path(), "rb") as f:
+                cached_key, data = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return data if cached_key == key else None
+
+    def _write_cache(self, key: tuple, data: tuple) -> None:
+        """Atomically replace the cache file; failures only cost a reparse."""
+        import tempfile
+
+        path = self._cache_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".pacman-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    marshal.dump((key, data), f)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except (OSError, ValueError) as e:
+            print(f"Error writing pacman cache: {e}")
+
+    def load(self) -> None:
+        """Bring the parsed databases up to date with the files on disk."""
+        with self._lock:
+            sources = self._sources()
+            key = self._current_key(sources)
+            if key == self._key:
+                return
+
+            data = self._read_cache(key)
+            if data is None:
+                repos = [read_sync_db(path) for path in sources[:-1]]
+                data = (repos, read_local_db(sources[-1]))
+                self._write_cache(key, data)
+
+            self._repos, self._local = data
+            self._providers = {}
+            for repo in reversed(self._repos):
+                for name, pkg in repo.items():
+                    for provided in pkg[2]:
+                        self._providers[provided] = name
+            self._local_provides = {p for pkg in self._local.values() for p in pkg[2]}
+            # The installer runs a full upgrade; remember what that downloads
+            self._upgrade_size = 0
+            for name, local in self._local.items():
+                synced = self._sync_package(name)
+                if synced and synced[0] == name and vercmp(synced[1][0], local[0]) > 0:
+                    self._upgrade_size += synced[1][3]
+            self._key = key
+
+    def _sync_package(self, name: str) -> tuple[str, Package] | None:
+        """Find ``name`` in the first repository that has it, or a provider."""
+        for repo in self._repos:
+            if name in repo:
+                return name, repo[name]
+        provider = self._providers.get(name)
+        if provider:
+            return self._sync_package(provider) if provider != name else None
+        return None
+
+    def _is_satisfied(self, name: str) -> bool:
+        return name in self._local or name in self._local_provides
+
+    def plan(self, package: str) -> InstallPlan:
+        """Plan the install of ``package`` against the current databases."""
+        with self._lock:
+            self.load()
+            return self._plan(package)
+
+    def _plan(self, package: str) -> InstallPlan:
+        target = self._sync_package(package)
+        if target is None:
+            return InstallPlan(package, False, (), 0, 0, (), 0, ())
+
+        added: dict[str, Package] = {}
+        outdated: set[str] = set()
+        unresolved: set[str] = set()
+        pending = [target]
+        while pending:
+            name, pkg = pending.pop()
+            if name in added:
+                continue
+            added[name] = pkg
+            for dep in pkg[1]:
+                dep_name = _dep_name(dep)
+                if self._is_satisfied(dep_name):
+                    local = self._local.get(dep_name)
+                    synced = self._sync_package(dep_name)
+                    if local and synced and vercmp(synced[1][0], local[0]) > 0:
+                        outdated.add(dep_name)
+                    continue
+                found = self._sync_package(dep_name)
+                if found is None:
+                    unresolved.add(dep_name)
+                elif found[0] not in added:
+                    pending.append(found)
+
+        return InstallPlan(
+            package,
+            True,
+            tuple(sorted(added)),
+            sum(pkg[3] for pkg in added.values()),
+            sum(pkg[4] for pkg in added.values()),
+            tuple(sorted(outdated)),
+            self._upgrade_size,
+            tuple(sorted(unresolved)),
+        )
+
+    def plan_many(self, packages: list[str]) -> dict[str, InstallPlan]:
+        """Plan several installs against one consistent state of the databases."""
+        with self._lock:
+            self.load()
+            return {package: self._plan(package) for package in packages}
@@ -0,0 +1,103 @@
+"""Compiled cache for pages.yaml.
+
+Warm starts load a marshal dump of the parsed pages instead of importing
+PyYAML. The cache is keyed by the source path, its mtime and size, the
+application version and the Python and marshal versions, so any change to
+them invalidates it. When the pages
+come from the GResource bundle, the bundle file is the source of the key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import sys
+from collections.abc import Callable
+
+from startup_profile import PROFILER
+from xdg import cache_home
+
+# Bump when the layout of the cache file changes
+CACHE_FORMAT = 1
+
+
+def cache_dir() -> str:
+    """Return the per-user cache directory of the application."""
+    return os.path.join(cache_home(), "biglinux-welcome")
+
+
+def _cache_path(source: str) -> str:
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir(), f"pages-{digest}.marshal")
+
+
+def _cache_key(source: str, st: os.stat_result, app_version: str) -> tuple:
+    # The marshal format may change with the Python version
+    return (CACHE_FORMAT, marshal.version, sys.version_info[:2], source, st.st_mtime_ns, st.st_size, app_version)
+
+
+def _read_cache(path: str, key: tuple) -> list | None:
+    try:
+        with open(path, "rb") as f:
+            cached_key, data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return data if cached_key == key else None
+
+
+def _write_cache(path: str, key: tuple, data: list) -> None:
+    """Atomically replace the cache file; failures only cost a rebuild."""
+    import tempfile
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".pages-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                marshal.dump((key, data), f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except (OSError, ValueError) as e:
+        print(f"Error writing pages cache: {e}")
+
+
+def _parse_yaml(source: str, read: Callable[[], bytes | None] | None) -> list | None:
+    """Parse pages.yaml with libyaml when available."""
+    with PROFILER.phase("import:yaml"):
+        import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        if read is not None:
+            data = read()
+            return None if data is None else yaml.load(data, Loader=loader)
+        with open(source, encoding="utf-8") as f:
+            return yaml.load(f, Loader=loader)
+    except (FileNotFoundError, yaml.YAMLError):
+        return None
+
+
+def load_pages(source: str, app_version: str, read: Callable[[], bytes | None] | None = None) -> list | None:
+    """Load the page definitions, using the compiled cache when it is fresh.
+
+    ``read`` returns the YAML when it does not come from ``source`` itself.
+    Returns None when the file is missing or cannot be parsed.
+    """
+    try:
+        st = os.stat(source)
+    except OSError:
+        return None
+
+    key = _cache_key(source, st, app_version)
+    path = _cache_path(source)
+    data = _read_cache(path, key)
+    if data is not None:
+        return data
+
+    data = _parse_yaml(source, read)
+    if data is not None:
+        _write_cache(path, key, data)
+    return data
@@ -0,0 +1,175 @@
+"""Non-blocking helper process execution on top of Gio.Subprocess.
+
+Every external command the window runs goes through here so the main loop
+never waits on a child. Results are delivered to callbacks on the main
+loop. Each call can have a timeout, after which the child is killed, and
+a ``Gio.Cancellable`` that is normally tied to the window's lifetime.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import NamedTuple
+
+from gi.repository import Gio, GLib
+
+# Timeout in seconds of the short helper calls; installs run without one,
+# since pkexec may wait on the password prompt and pacman on slow mirrors
+HELPER_TIMEOUT = 15
+
+
+class ProcessResult(NamedTuple):
+    """Outcome of one helper process."""
+
+    status: int | None  # exit status; None if it did not exit normally
+    stdout: str
+    stderr: str
+    timed_out: bool = False
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 0
+
+
+def _start(argv: list[str], flags: Gio.SubprocessFlags) -> tuple[Gio.Subprocess | None, str | None]:
+    try:
+        return Gio.Subprocess.new(argv, flags), None
+    except GLib.Error as e:
+        return None, e.message
+
+
+def run_async(
+    argv: list[str],
+    callback: Callable[[ProcessResult], None],
+    timeout: float | None = HELPER_TIMEOUT,
+    cancellable: Gio.Cancellable | None = None,
+    stdin: str | None = None,
+    kill_on_cancel: bool = True,
+) -> Gio.Subprocess | None:
+    """Run ``argv`` and pass its captured output to ``callback``.
+
+    The callback is not called once ``cancellable`` is cancelled, since its
+    owner is going away. With ``kill_on_cancel`` False, cancelling only
+    stops waiting for the child; use that for privileged work that must not
+    be interrupted.
+    """
+    flags = Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_PIPE
+    if stdin is not None:
+        flags |= Gio.SubprocessFlags.STDIN_PIPE
+    proc, error = _start(argv, flags)
+    if proc is None:
+        print(f"Error starting {argv[0]}: {error}")
+
+        def report_error() -> bool:
+            callback(ProcessResult(None, "", "", error=error))
+            return GLib.SOURCE_REMOVE
+
+        GLib.idle_add(report_error)
+        return None
+
+    state = {"timed_out": False, "timeout_id": 0}
+
+    def on_timeout() -> bool:
+        state["timed_out"] = True
+        state["timeout_id"] = 0
+        proc.force_exit()
+        return GLib.SOURCE_REMOVE
+
+    if timeout:
+        state["timeout_id"] = GLib.timeout_add(int(timeout * 1000), on_timeout)
+
+    def on_done(_proc: Gio.Subprocess, res: Gio.AsyncResult) -> None:
+        if state["timeout_id"]:
+            GLib.source_remove(state["timeout_id"])
+
+        try:
+            _ok, out, err = proc.communicate_utf8_finish(res)
+        except GLib.Error as e:
+            if e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                if kill_on_cancel:
+                    proc.force_exit()
+                return
+            callback(ProcessResult(None, "", "", state["timed_out"], error=e.message))
+            return
+
+        status = proc.get_exit_status() if proc.get_if_exited() else None
+        callback(ProcessResult(status, out or "", err or "", state["timed_out"]))
+
+    proc.communicate_utf8_async(stdin, cancellable, on_done)
+    return proc
+
+
+def stream_lines(
+    argv: list[str],
+    on_line: Callable[[str], None],
+    on_exit: Callable[[ProcessResult], None],
+    timeout: float | None = None,
+    cancellable: Gio.Cancellable | None = None,
+    kill_on_cancel: bool = True,
+) -> Gio.Subprocess | None:
+    """Run ``argv`` and hand each stdout line to ``on_line`` as it arrives.
+
+    ``on_exit`` gets the exit status once the output is exhausted; output
+    is not collected in the result. Cancellation behaves as in run_async.
+    """
+    flags = Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_SILENCE
+    proc, error = _start(argv, flags)
+    if proc is None:
+        print(f"Error starting {argv[0]}: {error}")
+
+        def report_error() -> bool:
+            on_exit(ProcessResult(None, "", "", error=error))
+            return GLib.SOURCE_REMOVE
+
+        GLib.idle_add(report_error)
+        return None
+
+    stream = Gio.DataInputStream.new(proc.get_stdout_pipe())
+    state = {"timed_out": False, "timeout_id": 0}
+
+    def on_timeout() -> bool:
+        state["timed_out"] = True
+        state["timeout_id"] = 0
+        proc.force_exit()
+        return GLib.SOURCE_REMOVE
+
+    if timeout:
+        state["timeout_id"] = GLib.timeout_add(int(timeout * 1000), on_timeout)
+
+    def handle_error(e: GLib.Error) -> bool:
+        """Return True when the error means the caller went away."""
+        if e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+            if state["timeout_id"]:
+                GLib.source_remove(state["timeout_id"])
+            if kill_on_cancel:
+                proc.force_exit()
+            return True
+        return False
+
+    def on_read(_stream: Gio.DataInputStream, res: Gio.AsyncResult) -> None:
+        try:
+            line, _length = stream.read_line_finish_utf8(res)
+        except GLib.Error as e:
+            if handle_error(e):
+                return
+            line = None
+        if line is None:
+            proc.wait_async(cancellable, on_wait)
+            return
+        on_line(line)
+        stream.read_line_async(GLib.PRIORITY_DEFAULT, cancellable, on_read)
+
+    def on_wait(_proc: Gio.Subprocess, res: Gio.AsyncResult) -> None:
+        try:
+            proc.wait_finish(res)
+        except GLib.Error as e:
+            if handle_error(e):
+                return
+        if state["timeout_id"]:
+            GLib.source_remove(state["timeout_id"])
+        status = proc.get_exit_status() if proc.get_if_exited() else None
+        on_exit(ProcessResult(status, "", "", state["timed_out"]))
+
+    stream.read_line_async(GLib.PRIORITY_DEFAULT, cancellable, on_read)
+    return proc
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""On-disk cache of pre-rasterized images.
+
+SVGs are rendered once per pixel size and kept as PNG files. Each PNG
+stores the mtime and a BLAKE2 hash of its source, so a changed source is
+re-rendered while a touched but identical one is still reused. Lookups try
+the per-user cache first and then the system-wide copy that the package
+install hook builds with ``raster_cache.py --system``.
+
+Sources may also be ``resource://`` URIs into the GResource bundle; those
+are checked against the bundle file's mtime and the resource's own bytes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+
+import gi
+
+gi.require_version("GdkPixbuf", "2.0")
+
+from gi.repository import GdkPixbuf, Gio, GLib  # noqa: E402
+
+import resources  # noqa: E402
+from xdg import cache_home  # noqa: E402
+
+SYSTEM_CACHE_DIR = "/var/cache/biglinux-welcome/icons"
+
+# Bump when the rendering or the metadata layout changes
+CACHE_FORMAT = "1"
+
+# Logical sizes requested by the UI: action icons, browser icons,
+# the welcome logo and the QR codes
+BROWSER_ICON_SIZE = 56
+ACTION_ICON_SIZE = 64
+LOGO_SIZE = 130
+QRCODE_SIZE = 200
+PREBUILT_SCALES = (1, 2)
+
+RESOURCE_SCHEME = "resource://"
+
+
+def user_cache_dir() -> str:
+    return os.path.join(cache_home(), "biglinux-welcome", "icons")
+
+
+def _entry_name(source: str, pixels: int) -> str:
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:20]
+    return f"{digest}-{pixels}.png"
+
+
+def _stat_source(source: str) -> os.stat_result:
+    """Stat a file, or the bundle holding a resource."""
+    if source.startswith(RESOURCE_SCHEME):
+        path = source[len(RESOURCE_SCHEME) :]
+        try:
+            Gio.resources_get_info(path, Gio.ResourceLookupFlags.NONE)
+        except GLib.Error as e:
+            raise FileNotFoundError(path) from e
+        return os.stat(resources.BUNDLE)
+    return os.stat(source)
+
+
+def _source_hash(source: str) -> str:
+    if source.startswith(RESOURCE_SCHEME):
+        try:
+            data = Gio.resources_lookup_data(source[len(RESOURCE_SCHEME) :], Gio.ResourceLookupFlags.NONE)
+        except GLib.Error as e:
+            raise OSError(str(e)) from e
+        return hashlib.blake2b(data.get_data(), digest_size=16).hexdigest()
+    with open(source, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def _render(source: str, pixels: int) -> GdkPixbuf.Pixbuf:
+    """Decode ``source`` at ``pixels`` x ``pixels``; raises GLib.Error."""
+    if source.startswith(RESOURCE_SCHEME):
+        return GdkPixbuf.Pixbuf.new_from_resource_at_scale(source[len(RESOURCE_SCHEME) :], pixels, pixels, True)
+    return GdkPixbuf.Pixbuf.new_from_file_at_size(source, pixels, pixels)
+
+
+def _load_entry(entry: str, source: str, st: os.stat_result) -> GdkPixbuf.Pixbuf | None:
+    """Load a cached PNG if it still matches its source."""
+    try:
+        pb = GdkPixbuf.Pixbuf.new_from_file(entry)
+    except GLib.Error:
+        return None
+
+    if pb.get_option("tEXt::format") != CACHE_FORMAT:
+        return None
+    if pb.get_option("tEXt::mtime") == str(st.st_mtime_ns):
+        return pb
+    # Same content with a new mtime (e.g. reinstalled package) is still valid
+    try:
+        if pb.get_option("tEXt::hash") != _source_hash(source):
+            return None
+    except OSError:
+        return None
+    # Record the new mtime so later starts match without hashing the source;
+    # an entry of the read-only system cache gets its copy in the user one
+    _store_entry(os.path.join(user_cache_dir(), os.path.basename(entry)), pb, source, st)
+    return pb
+
+
+def _store_entry(entry: str, pb: GdkPixbuf.Pixbuf, source: str, st: os.stat_result) -> None:
+    """Atomically write a rendered image with its source metadata."""
+    import tempfile
+
+    directory = os.path.dirname(entry)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".icon-", suffix=".png")
+        os.close(fd)
+        try:
+            pb.savev(
+                tmp,
+                "png",
+                ["tEXt::format", "tEXt::mtime", "tEXt::hash"],
+                [CACHE_FORMAT, str(st.st_mtime_ns), _source_hash(source)],
+            )
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, entry)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except (OSError, GLib.Error) as e:
+        print(f"Error writing icon cache: {e}")
+
+
+def load_pixbuf(source: str, pixels: int) -> GdkPixbuf.Pixbuf | None:
+    """Return ``source`` rendered at ``pixels`` x ``pixels``.
+
+    Returns None when the source is missing or cannot be decoded.
+    """
+    try:
+        st = _stat_source(source)
+    except OSError:
+        return None
+
+    name = _entry_name(source, pixels)
+    for directory in (user_cache_dir(), SYSTEM_CACHE_DIR):
+        pb = _load_entry(os.path.join(directory, name), source, st)
+        if pb is not None:
+            return pb
+
+    try:
+        pb = _render(source, pixels)
+    except GLib.Error:
+        return None
+    _store_entry(os.path.join(user_cache_dir(), name), pb, source, st)
+    return pb
+
+
+def _logo_sources() -> list[str]:
+    """Return the distribution logo the welcome page shows, if any."""
+    logo = ""
+    try:
+        with open("/etc/os-release", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("LOGO="):
+                    logo = line.strip().split("=", 1)[1].strip("\"'")
+    except OSError:
+        return []
+    if not logo:
+        return []
+    for path in (f"/usr/share/pixmaps/{logo}", f"/usr/share/pixmaps/{logo}.png", f"/usr/share/pixmaps/{logo}.svg"):
+        if os.path.exists(path):
+            return [path]
+    return []
+
+
+def prebuilt_sources() -> list[tuple[str, int]]:
+    """List every bundled image with the logical size the UI shows it at.
+
+    Images are named the way the UI loads them: as resource URIs when the
+    bundle is registered, as file paths otherwise.
+    """
+    sources = []
+    # Installed packages only ship the bundle, so list what it holds
+    for relative in resources.list_files("image"):
+        if not relative.endswith((".svg", ".png")):
+            continue
+        name = os.path.basename(relative)
+        if os.path.basename(os.path.dirname(relative)) == "browsers":
+            size = BROWSER_ICON_SIZE
+        elif "qrcode" in name.lower():
+            size = QRCODE_SIZE
+        else:
+            size = ACTION_ICON_SIZE
+        sources.append((resources.asset(relative), size))
+    sources.extend((path, LOGO_SIZE) for path in _logo_sources())
+    return sources
+
+
+def build(directory: str) -> int:
+    """Render all bundled images into ``directory``; returns the count."""
+    count = 0
+    for source, size in prebuilt_sources():
+        try:
+            st = _stat_source(source)
+        except OSError:
+            continue
+        for scale in PREBUILT_SCALES:
+            pixels = size * scale
+            entry = os.path.join(directory, _entry_name(source, pixels))
+            if _load_entry(entry, source, st) is not None:
+                continue
+            try:
+                pb = _render(source, pixels)
+            except GLib.Error as e:
+                print(f"Error rendering {source}: {e}")
+                continue
+            _store_entry(entry, pb, source, st)
+            count += 1
+    return count
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pre-render BigLinux Welcome images.")
+    parser.add_argument(
+        "--system", action="store_true", help=f"build the system-wide cache in {SYSTEM_CACHE_DIR}"
+    )
+    parser.add_argument("--output", help="build the cache in this directory")
+    args = parser.parse_args()
+
+    resources.register()
+    directory = args.output or (SYSTEM_CACHE_DIR if args.system else user_cache_dir())
+    print(f"Rendered {build(directory)} images into {directory}")
+
+
+if __name__ == "__main__":
+    main()
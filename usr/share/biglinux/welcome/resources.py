@@ -0,0 +1,100 @@
+"""Access to the bundled assets: style.css, pages.yaml and image/.
+
+Packaged builds ship only ``biglinux-welcome.gresource``, made by
+build_resources.py. ``register`` maps it once and then every asset is read
+through ``resource://`` URIs, with no per-file path probing.
+
+A source checkout has the plain files next to main.py, and they are used
+even if a bundle was built there, so edits show up without rebuilding it.
+``BIGLINUX_WELCOME_NO_GRESOURCE=0`` loads the bundle anyway and ``=1``
+never loads it.
+"""
+
+from __future__ import annotations
+
+import os
+
+from gi.repository import Gio, GLib
+
+APP_PATH = os.path.dirname(os.path.abspath(__file__))
+BUNDLE = os.path.join(APP_PATH, "biglinux-welcome.gresource")
+PREFIX = "/org/biglinux/welcome"
+DEV_ENV = "BIGLINUX_WELCOME_NO_GRESOURCE"
+
+_registered = False
+
+
+def _in_checkout() -> bool:
+    """Whether the plain assets are here, as in the source tree."""
+    return os.path.exists(os.path.join(APP_PATH, "style.css"))
+
+
+def register() -> bool:
+    """Load and register the bundle; returns whether assets come from it."""
+    global _registered
+    if _registered:
+        return True
+    dev = os.environ.get(DEV_ENV, "")
+    if dev not in ("", "0") or (dev == "" and _in_checkout()):
+        return False
+    try:
+        Gio.resources_register(Gio.Resource.load(BUNDLE))
+    except GLib.Error as e:
+        if not e.matches(GLib.file_error_quark(), GLib.FileError.NOENT):
+            print(f"Error loading {BUNDLE}: {e.message}")
+        return False
+    _registered = True
+    return True
+
+
+def is_registered() -> bool:
+    return _registered
+
+
+def resource_path(name: str) -> str:
+    """Path of the asset ``name`` (relative to the app dir) in the bundle."""
+    return f"{PREFIX}/{name}"
+
+
+def asset(name: str) -> str:
+    """Return a ``resource://`` URI or a file path for the asset ``name``."""
+    if _registered:
+        return "resource://" + resource_path(name)
+    return os.path.join(APP_PATH, name)
+
+
+def list_files(directory: str) -> list[str]:
+    """Names of the assets below ``directory``, relative to the app dir."""
+    names = []
+    if _registered:
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            try:
+                children = Gio.resources_enumerate_children(resource_path(current), Gio.ResourceLookupFlags.NONE)
+            except GLib.Error:
+                continue
+            for child in children:
+                # Directories are listed with a trailing slash
+                if child.endswith("/"):
+                    pending.append(f"{current}/{child[:-1]}")
+                else:
+                    names.append(f"{current}/{child}")
+    else:
+        for root, _dirs, files in os.walk(os.path.join(APP_PATH, directory)):
+            names += [os.path.relpath(os.path.join(root, name), APP_PATH) for name in files]
+    return sorted(names)
+
+
+def read_bytes(name: str) -> bytes | None:
+    """Return the contents of the asset ``name``, or None if it is missing."""
+    if _registered:
+        try:
+            return Gio.resources_lookup_data(resource_path(name), Gio.ResourceLookupFlags.NONE).get_data()
+        except GLib.Error:
+            return None
+    try:
+        with open(os.path.join(APP_PATH, name), "rb") as f:
+            return f.read()
+    except OSError:
+        return None
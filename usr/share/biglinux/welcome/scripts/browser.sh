@@ -11,12 +11,13 @@ setDefaultBrowser() {
   xdg-settings set default-web-browser $1
 }
 
-# change the state
+# Installs every target ("repo:<package>" or "aur:<package>") with a single
+# authentication; progress is streamed to stdout as JSON lines
 installBrowser() {
   # Get the directory where the script is located
   local script_dir
   script_dir="$(dirname "$(readlink -f "$0")")"
-  pkexec "$script_dir/browserInstall.sh" "$1" "$USER" "$DISPLAY" "$XAUTHORITY" "$DBUS_SESSION_BUS_ADDRESS" "$LANG" "$LANGUAGE"
+  pkexec "$script_dir/browserInstall.py" "$@"
   exitCode=$?
   exit $exitCode
 }
@@ -27,7 +28,7 @@ case "$1" in
     #     checkBrowserState "$2"
     #     ;;
     "install")
-        installBrowser "$2"
+        installBrowser "${@:2}"
         ;;
     "getBrowser")
         getDefaultBrowser
@@ -38,7 +39,7 @@ case "$1" in
     *)
         echo "Use: $0 {check|install} [true|false]"
         echo "  check          - Check current status"
-        echo "  install        - install the specified browser"
+        echo "  install        - install the specified browsers (repo:<pkg> or aur:<pkg>)"
         exit 1
         ;;
 esac
@@ -0,0 +1,202 @@
+#!/usr/bin/python3
+"""Privileged browser installer, run through pkexec by browser.sh.
+
+Arguments are install targets, ``repo:<package>`` or ``aur:<package>``.
+Progress is written to stdout as JSON lines, one event per line:
+
+    {"phase": "sync"}
+    {"phase": "download", "package": "firefox", "bytes": 123, "total": 456, "percent": 27,
+     "packages": {"firefox": [100, 400]}}
+    {"phase": "install", "package": "firefox", "percent": 50}
+    {"phase": "aur", "package": "google-chrome"}
+    {"phase": "result", "package": "firefox", "ok": true}
+    {"phase": "done", "ok": true}
+
+Download bytes count the whole transaction; ``packages`` has the bytes
+downloaded and the size of the requested packages' own files.
+
+The repo packages go through one database sync and one transaction; the
+AUR packages are built afterwards without syncing again. Tool output is
+appended to /var/log/biglinux-welcome.log.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+
+LOG_PATH = "/var/log/biglinux-welcome.log"
+PACKAGE_CACHE = "/var/cache/pacman/pkg"
+PACKAGE_NAME = re.compile(r"^[a-z0-9@._+-]+$")
+# "(1/3) installing firefox", "( 1/12) installing firefox" when pacman pads
+# the counter, or "installing firefox..."
+INSTALL_LINE = re.compile(r"(?:\(\s*(\d+)/(\d+)\)\s+)?(?:installing|upgrading|reinstalling)\s+([a-z0-9@._+-]+?)(?:\.\.\.)?\s*$")
+POLL_INTERVAL = 0.5
+
+
+def emit(phase: str, **fields) -> None:
+    """Write one progress event; a closed stdout must not stop the install."""
+    try:
+        print(json.dumps({"phase": phase, **fields}), flush=True)
+    except OSError:
+        # The window went away mid-install: finish the transaction without
+        # reporting, since pacman must never be interrupted partway
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+
+
+def run_logged(cmd: list[str], log, on_line=None) -> int:
+    """Run a command, appending its output to the log line by line."""
+    log.write(f"$ {' '.join(cmd)}\n")
+    log.flush()
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace")
+    for line in proc.stdout:
+        log.write(line)
+        if on_line:
+            on_line(line.rstrip("\n"))
+    log.flush()
+    return proc.wait()
+
+
+def planned_downloads(packages: list[str]) -> dict[str, tuple[str, int]]:
+    """Return {file name: (package, size)} of what the transaction downloads."""
+    result = subprocess.run(
+        ["pacman", "-Sup", "--needed", "--print-format", "%n %s %l", *packages],
+        capture_output=True,
+        text=True,
+    )
+    files = {}
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) != 3 or not parts[1].isdigit():
+            continue
+        name = os.path.basename(parts[2])
+        # Packages already in the cache are not downloaded again
+        if not os.path.exists(os.path.join(PACKAGE_CACHE, name)):
+            files[name] = (parts[0], int(parts[1]))
+    return files
+
+
+def download_dirs() -> list[str]:
+    """Return the directories pacman downloads into.
+
+    That is the cache itself and, since pacman 7, the ``download-XXXXXX``
+    directories its sandboxed download user writes to before the finished
+    files are moved into the cache.
+    """
+    dirs = [PACKAGE_CACHE]
+    try:
+        with os.scandir(PACKAGE_CACHE) as it:
+            dirs += [entry.path for entry in it if entry.name.startswith("download-") and entry.is_dir()]
+    except OSError:
+        pass
+    return dirs
+
+
+def watch_downloads(files: dict[str, tuple[str, int]], targets: list[str], stop: threading.Event) -> None:
+    """Report downloaded bytes by polling the package cache."""
+    total = sum(size for _package, size in files.values())
+    while not stop.wait(POLL_INTERVAL):
+        done = 0
+        current = None
+        own = {}
+        directories = download_dirs()
+        for name, (package, size) in files.items():
+            paths = [os.path.join(d, file) for d in directories for file in (name, name + ".part")]
+            for path in paths:
+                try:
+                    got = min(os.path.getsize(path), size)
+                except OSError:
+                    continue
+                done += got
+                if package in targets:
+                    own[package] = [got, size]
+                if got < size and path.endswith(".part"):
+                    current = package
+                break
+        for package, size in files.values():
+            if package in targets:
+                own.setdefault(package, [0, size])
+        percent = int(done * 100 / total) if total else 100
+        emit("download", package=current, bytes=done, total=total, percent=percent, packages=own)
+
+
+def install_repo(packages: list[str], log) -> None:
+    emit("sync")
+    if run_logged(["pacman", "-Sy", "--noconfirm"], log) != 0:
+        return
+
+    # Download first so the progress can be measured, then install from the cache
+    files = planned_downloads(packages)
+    if files:
+        stop = threading.Event()
+        watcher = threading.Thread(target=watch_downloads, args=(files, packages, stop), daemon=True)
+        watcher.start()
+        code = run_logged(["pacman", "-Suw", "--needed", "--noconfirm", *packages], log)
+        stop.set()
+        watcher.join()
+        total = sum(size for _package, size in files.values())
+        own = {package: [size if code == 0 else 0, size] for package, size in files.values() if package in packages}
+        emit(
+            "download",
+            package=None,
+            bytes=total if code == 0 else 0,
+            total=total,
+            percent=100 if code == 0 else 0,
+            packages=own,
+        )
+        if code != 0:
+            return
+
+    def on_line(line: str) -> None:
+        match = INSTALL_LINE.search(line)
+        if match:
+            index, count, package = match.groups()
+            percent = int(int(index) * 100 / int(count)) if index else None
+            emit("install", package=package, percent=percent)
+
+    emit("install", package=None, percent=0)
+    run_logged(["pacman", "-Su", "--needed", "--noconfirm", *packages], log, on_line)
+
+
+def is_installed(package: str) -> bool:
+    return subprocess.run(["pacman", "-Q", package], capture_output=True).returncode == 0
+
+
+def main() -> int:
+    repo_packages, aur_packages, invalid = [], [], []
+    for target in sys.argv[1:]:
+        source, _, package = target.partition(":")
+        if not PACKAGE_NAME.match(package) or source not in ("repo", "aur"):
+            invalid.append(package)
+        elif source == "repo":
+            repo_packages.append(package)
+        else:
+            aur_packages.append(package)
+
+    with open(LOG_PATH, "a", encoding="utf-8") as log:
+        log.write(f"\n{time.ctime()}\n")
+        if repo_packages:
+            install_repo(repo_packages, log)
+        for package in aur_packages:
+            emit("aur", package=package)
+            run_logged(["yay", "-S", "--needed", "--noconfirm", package], log)
+
+    ok = True
+    for package in invalid:
+        emit("result", package=package, ok=False)
+        ok = False
+    for package in repo_packages + aur_packages:
+        installed = is_installed(package)
+        emit("result", package=package, ok=installed)
+        ok = ok and installed
+    emit("done", ok=ok)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""Opt-in startup profiler for BigLinux Welcome.
+
+Enabled with ``--profile-startup[=PATH]`` on the command line or the
+``BIGLINUX_WELCOME_PROFILE`` environment variable (``1`` for the default
+location, anything else is taken as the output path). Only the standard
+library is used here so it can time the GTK imports themselves.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+FLAG = "--profile-startup"
+ENV_VAR = "BIGLINUX_WELCOME_PROFILE"
+
+
+def _default_path() -> str:
+    # Not xdg.cache_home(): this module is imported first to time every other
+    # one, including the application's own, so it imports none of them
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache, "biglinux-welcome", "startup-profile.json")
+
+
+def _take_flag(argv: list[str]) -> str | None:
+    """Remove the profiling flag from argv and return the requested path."""
+    for i, arg in enumerate(argv[1:], start=1):
+        if arg == FLAG:
+            del argv[i]
+            return ""
+        if arg.startswith(FLAG + "="):
+            del argv[i]
+            return arg.split("=", 1)[1]
+    return None
+
+
+class StartupProfiler:
+    """Collects wall and CPU time per startup phase."""
+
+    def __init__(self, output: str | None) -> None:
+        self.enabled = output is not None
+        self.output = output or _default_path()
+        self.wall_origin = time.perf_counter()
+        self.cpu_origin = time.process_time()
+        self.phases: list[dict] = []
+        self.marks: list[dict] = []
+        self.notes: dict[str, object] = {}
+        self._depth = 0
+        self._written = False
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as one named phase."""
+        if not self.enabled:
+            yield
+            return
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        entry = {
+            "name": name,
+            "depth": self._depth,
+            "start_ms": round((wall_start - self.wall_origin) * 1000, 3),
+        }
+        self.phases.append(entry)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            entry["wall_ms"] = round((time.perf_counter() - wall_start) * 1000, 3)
+            entry["cpu_ms"] = round((time.process_time() - cpu_start) * 1000, 3)
+
+    def mark(self, name: str) -> None:
+        """Record a point in time (e.g. the first presented frame)."""
+        if not self.enabled:
+            return
+        self.marks.append({
+            "name": name,
+            "wall_ms": round((time.perf_counter() - self.wall_origin) * 1000, 3),
+            "cpu_ms": round((time.process_time() - self.cpu_origin) * 1000, 3),
+        })
+
+    def note(self, name: str, value: object) -> None:
+        """Attach a value measured outside the profiled phases to the report."""
+        if self.enabled:
+            self.notes[name] = value
+
+    def report(self) -> dict:
+        """Return the collected timings as a JSON-serializable dict."""
+        return {
+            "pid": os.getpid(),
+            "argv": sys.argv,
+            "python": sys.version.split()[0],
+            # CPU already spent by the interpreter before this module loaded
+            "cpu_before_profiler_ms": round(self.cpu_origin * 1000, 3),
+            "phases": self.phases,
+            "marks": self.marks,
+            "notes": self.notes,
+        }
+
+    def write(self) -> None:
+        """Write the report once; later calls are ignored."""
+        if not self.enabled or self._written:
+            return
+        self._written = True
+        import json
+
+        try:
+            os.makedirs(os.path.dirname(self.output) or ".", exist_ok=True)
+            with open(self.output, "w", encoding="utf-8") as f:
+                json.dump(self.report(), f, indent=2)
+            print(f"Startup profile written to {self.output}", file=sys.stderr)
+        except OSError as e:
+            print(f"Error writing startup profile: {e}", file=sys.stderr)
+
+
+def _from_environment() -> StartupProfiler:
+    path = _take_flag(sys.argv)
+    if path is None:
+        env = os.environ.get(ENV_VAR, "")
+        if env and env != "0":
+            path = "" if env == "1" else env
+    return StartupProfiler(path)
+
+
+PROFILER = _from_environment()
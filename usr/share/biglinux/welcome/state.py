@@ -0,0 +1,225 @@
+"""Persistent application state on top of ``GLib.KeyFile``.
+
+Everything the window remembers between runs lives in one key file,
+``$XDG_CONFIG_HOME/biglinux-welcome/state.ini``: whether to show at login,
+whether the tour was completed, the last visited page, the actions that
+were started and the browser that was chosen. Reads are served from the
+in-memory key file. Changes are coalesced for ``DEBOUNCE_MS`` and then
+written by a worker thread with ``GLib.file_set_contents``, which writes a
+temporary file and renames it over the old one.
+
+The autostart group is mirrored into the user's autostart entry
+(``Hidden=true``) for sessions that honour it; autostart.py reads the key
+file itself with configparser, before GTK is loaded.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+
+from gi.repository import GLib
+
+import autostart
+
+AUTOSTART = "autostart"
+SETUP = "setup"
+WINDOW = "window"
+ACTIONS = "actions"
+BROWSERS = "browsers"
+
+SYSTEM_AUTOSTART_FILE = "/etc/xdg/autostart/" + autostart.DESKTOP_ID
+
+
+def _write_file(path: str, data: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    GLib.file_set_contents(path, data.encode("utf-8"))
+
+
+def _write_autostart_entry(enabled: bool) -> None:
+    """Hide the user's autostart entry, or drop the keys that hide it."""
+    path = autostart.autostart_file()
+    entry = GLib.KeyFile()
+    flags = GLib.KeyFileFlags.KEEP_COMMENTS | GLib.KeyFileFlags.KEEP_TRANSLATIONS
+    try:
+        entry.load_from_file(path, flags)
+    except GLib.Error:
+        if enabled:
+            # No user entry means the system entry applies unchanged
+            return
+        try:
+            entry.load_from_file(SYSTEM_AUTOSTART_FILE, flags)
+        except GLib.Error as e:
+            print(f"Error reading {SYSTEM_AUTOSTART_FILE}: {e.message}")
+            return
+
+    group = "Desktop Entry"
+    if enabled:
+        changed = False
+        for key in ("Hidden", "X-GNOME-Autostart-enabled"):
+            try:
+                entry.remove_key(group, key)
+                changed = True
+            except GLib.Error:
+                pass
+        if not changed:
+            return
+    else:
+        entry.set_boolean(group, "Hidden", True)
+    _write_file(path, entry.to_data()[0])
+
+
+class StateStore:
+    """The application state, cached in memory and saved in the background."""
+
+    DEBOUNCE_MS = 500
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path or autostart.state_file()
+        self._keyfile = GLib.KeyFile()
+        try:
+            self._keyfile.load_from_file(self.path, GLib.KeyFileFlags.KEEP_COMMENTS)
+        except GLib.Error as e:
+            if not e.matches(GLib.file_error_quark(), GLib.FileError.NOENT):
+                print(f"Error reading {self.path}: {e.message}")
+        self._timeout_id = 0
+        self._autostart_dirty = False
+        # Snapshot waiting for the writer thread: (state data, autostart or None)
+        self._pending: tuple[str, bool | None] | None = None
+        self._lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+
+    # Reads, answered from memory
+
+    def get_boolean(self, group: str, key: str, default: bool = False) -> bool:
+        try:
+            return self._keyfile.get_boolean(group, key)
+        except GLib.Error:
+            return default
+
+    def get_integer(self, group: str, key: str, default: int = 0) -> int:
+        try:
+            return self._keyfile.get_integer(group, key)
+        except GLib.Error:
+            return default
+
+    def get_string(self, group: str, key: str, default: str | None = "") -> str | None:
+        try:
+            return self._keyfile.get_string(group, key)
+        except GLib.Error:
+            return default
+
+    def get_list(self, group: str, key: str) -> list[str]:
+        try:
+            return list(self._keyfile.get_string_list(group, key))
+        except GLib.Error:
+            return []
+
+    # Writes, saved after the debounce
+
+    def set_boolean(self, group: str, key: str, value: bool) -> None:
+        if self.get_boolean(group, key, not value) == value:
+            return
+        self._keyfile.set_boolean(group, key, value)
+        if group == AUTOSTART:
+            self._autostart_dirty = True
+        self._schedule()
+
+    def set_integer(self, group: str, key: str, value: int) -> None:
+        if self.get_integer(group, key, value + 1) == value:
+            return
+        self._keyfile.set_integer(group, key, value)
+        self._schedule()
+
+    def set_string(self, group: str, key: str, value: str) -> None:
+        if self.get_string(group, key, None) == value:
+            return
+        self._keyfile.set_string(group, key, value)
+        self._schedule()
+
+    def add_to_list(self, group: str, key: str, value: str) -> None:
+        values = self.get_list(group, key)
+        if value not in values:
+            self._keyfile.set_string_list(group, key, values + [value])
+            self._schedule()
+
+    # Autostart
+
+    def startup_enabled(self) -> bool:
+        """Whether the window opens at login, as autostart.py decides it."""
+        return (
+            self.get_boolean(AUTOSTART, "enabled", True)
+            and not self.get_boolean(SETUP, "completed")
+            and not autostart.is_hidden()
+        )
+
+    def set_startup_enabled(self, enabled: bool) -> None:
+        self.set_boolean(AUTOSTART, "enabled", enabled)
+        if enabled:
+            # Showing again at login overrides a completed tour
+            self.set_boolean(SETUP, "completed", False)
+        # The user entry may have been hidden by another tool; rewrite it
+        self._autostart_dirty = True
+        self._schedule()
+
+    # Saving
+
+    def _schedule(self) -> None:
+        if not self._timeout_id:
+            self._timeout_id = GLib.timeout_add(self.DEBOUNCE_MS, self._on_timeout)
+
+    def _on_timeout(self) -> bool:
+        self._timeout_id = 0
+        self._save(wait=False)
+        return GLib.SOURCE_REMOVE
+
+    def _snapshot(self) -> tuple[str, bool | None]:
+        enabled = None
+        if self._autostart_dirty:
+            enabled = self.get_boolean(AUTOSTART, "enabled", True)
+            self._autostart_dirty = False
+        return self._keyfile.to_data()[0], enabled
+
+    def _save(self, wait: bool) -> None:
+        """Hand the current state to the writer thread."""
+        snapshot = self._snapshot()
+        with self._lock:
+            previous = self._pending
+            # An autostart change still queued must not be lost
+            if previous and previous[1] is not None and snapshot[1] is None:
+                snapshot = (snapshot[0], previous[1])
+            self._pending = snapshot
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_pending, name="state-writer", daemon=True)
+                self._writer.start()
+            writer = self._writer
+        if wait:
+            writer.join()
+
+    def _write_pending(self) -> None:
+        """Writer thread: save snapshots until none is left."""
+        while True:
+            with self._lock:
+                snapshot, self._pending = self._pending, None
+                if snapshot is None:
+                    self._writer = None
+                    return
+            data, enabled = snapshot
+            try:
+                _write_file(self.path, data)
+                if enabled is not None:
+                    _write_autostart_entry(enabled)
+            except (GLib.Error, OSError) as e:
+                print(f"Error saving state: {e}")
+
+    def flush(self) -> None:
+        """Save pending changes now and wait for them; used when closing."""
+        if not self._timeout_id:
+            with self._lock:
+                writer = self._writer
+            if writer:
+                writer.join()
+            return
+        GLib.source_remove(self._timeout_id)
+        self._timeout_id = 0
+        self._save(wait=True)
@@ -0,0 +1,328 @@
+"""Process-wide texture cache and asynchronous icon loading.
+
+Images are rasterized once per (path, logical size, scale factor) at device
+resolution and shared as ``Gdk.Texture`` objects between every widget that
+shows them. The cache is an LRU bounded by the decoded pixel memory.
+
+Decoding happens on a small worker pool. Widgets get a fixed-size
+placeholder right away and the texture is swapped in from the main loop.
+Requests are tagged with the stack page that shows them, and the visible
+page is always served first. Theme icons go through the same queue but are
+looked up on the main thread, since ``Gtk.IconTheme`` is not thread-safe.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import contextmanager
+
+from gi.repository import Gdk, GLib, Gtk
+
+from raster_cache import load_pixbuf
+
+TextureKey = tuple[str, int, int]
+
+# Decoded RGBA bytes kept alive by the cache
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DECODE_WORKERS = 2
+
+
+class TextureCache:
+    """LRU cache of textures keyed by (path, size, scale)."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self._entries: OrderedDict[TextureKey, Gdk.Texture] = OrderedDict()
+        # Widgets currently showing each texture
+        self._users: dict[TextureKey, int] = {}
+
+    def lookup(self, key: TextureKey) -> Gdk.Texture | None:
+        """Return a cached texture and mark it as recently used."""
+        texture = self._entries.get(key)
+        if texture is not None:
+            self._entries.move_to_end(key)
+        return texture
+
+    def insert(self, key: TextureKey, texture: Gdk.Texture) -> None:
+        """Add a texture, evicting the least recently used unused entries."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.used_bytes -= _texture_bytes(old)
+        self._entries[key] = texture
+        self.used_bytes += _texture_bytes(texture)
+        self._evict()
+
+    def acquire(self, key: TextureKey) -> None:
+        self._users[key] = self._users.get(key, 0) + 1
+
+    def release(self, key: TextureKey) -> None:
+        count = self._users.get(key, 0) - 1
+        if count > 0:
+            self._users[key] = count
+        else:
+            self._users.pop(key, None)
+
+    def invalidate(self, key: TextureKey) -> None:
+        """Drop an entry that no widget is showing anymore."""
+        if key in self._users:
+            return
+        texture = self._entries.pop(key, None)
+        if texture is not None:
+            self.used_bytes -= _texture_bytes(texture)
+
+    def _evict(self) -> None:
+        for key in list(self._entries):
+            if self.used_bytes <= self.max_bytes:
+                break
+            if key not in self._users:
+                self.used_bytes -= _texture_bytes(self._entries.pop(key))
+
+
+def _texture_bytes(texture: Gdk.Texture) -> int:
+    return texture.get_width() * texture.get_height() * 4
+
+
+def display_scale() -> int:
+    """Best guess of the scale factor before a widget is realized."""
+    display = Gdk.Display.get_default()
+    if display is None:
+        return 1
+    monitors = display.get_monitors()
+    scales = [monitors.get_item(i).get_scale_factor() for i in range(monitors.get_n_items())]
+    return max(scales, default=1)
+
+
+class _Request:
+    """One pending decode or theme lookup."""
+
+    __slots__ = ("key", "group", "seq", "callbacks")
+
+    def __init__(self, key, group: int, seq: int) -> None:
+        self.key = key
+        self.group = group
+        self.seq = seq
+        self.callbacks: list[Callable] = []
+
+
+class IconLoader:
+    """Prioritized decode queue shared by every page."""
+
+    def __init__(self, workers: int = DECODE_WORKERS) -> None:
+        self.workers = workers
+        self.visible_group = 0
+        # Page being built right now; new requests are tagged with it
+        self.current_group = 0
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._files: dict[TextureKey, _Request] = {}
+        self._themes: dict[tuple, _Request] = {}
+        self._threads: list[threading.Thread] = []
+        self._theme_idle_id = 0
+
+    @contextmanager
+    def group(self, group: int):
+        """Tag requests made inside the block with ``group``."""
+        previous = self.current_group
+        self.current_group = group
+        try:
+            yield
+        finally:
+            self.current_group = previous
+
+    def set_visible_group(self, group: int) -> None:
+        """Serve requests for ``group`` before everything else."""
+        with self._cond:
+            self.visible_group = group
+
+    def _rank(self, req: _Request) -> tuple:
+        return (req.group != self.visible_group, req.group, req.seq)
+
+    def _add(self, queue: dict, key, callback: Callable) -> bool:
+        """Queue a callback for ``key``; returns True for a new request."""
+        req = queue.get(key)
+        is_new = req is None
+        if is_new:
+            req = queue[key] = _Request(key, self.current_group, next(self._seq))
+        else:
+            req.group = min(req.group, self.current_group)
+        req.callbacks.append(callback)
+        return is_new
+
+    def request_file(self, key: TextureKey, callback: Callable[[Gdk.Texture | None], None]) -> None:
+        """Decode ``key`` on a worker; ``callback`` runs on the main loop."""
+        with self._cond:
+            if self._add(self._files, key, callback):
+                self._cond.notify()
+        if len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._worker, daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._files:
+                    self._cond.wait()
+                req = min(self._files.values(), key=self._rank)
+                del self._files[req.key]
+            path, size, scale = req.key
+            pb = load_pixbuf(path, size * scale)
+            GLib.idle_add(self._finish_file, req, pb)
+
+    def _finish_file(self, req: _Request, pb) -> bool:
+        texture = None
+        if pb is not None:
+            texture = Gdk.Texture.new_for_pixbuf(pb)
+            TEXTURES.insert(req.key, texture)
+        for callback in req.callbacks:
+            callback(texture)
+        return GLib.SOURCE_REMOVE
+
+    def request_theme(self, name: str, size: int, scale: int, callback: Callable[[Gdk.Paintable], None]) -> None:
+        """Look up a theme icon from an idle callback on the main loop."""
+        self._add(self._themes, (name, size, scale), callback)
+        if not self._theme_idle_id:
+            self._theme_idle_id = GLib.idle_add(self._on_theme_idle)
+
+    def _on_theme_idle(self) -> bool:
+        """Resolve one theme icon per main loop iteration."""
+        req = min(self._themes.values(), key=self._rank)
+        del self._themes[req.key]
+        name, size, scale = req.key
+        theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())
+        paintable = theme.lookup_icon(name, None, size, scale, Gtk.TextDirection.NONE, 0)
+        for callback in req.callbacks:
+            callback(paintable)
+
+        if self._themes:
+            return GLib.SOURCE_CONTINUE
+        self._theme_idle_id = 0
+        return GLib.SOURCE_REMOVE
+
+
+TEXTURES = TextureCache()
+LOADER = IconLoader()
+
+
+def _placeholder(size: int) -> Gtk.Image:
+    img = Gtk.Image()
+    img.set_pixel_size(size)
+    # Keep the final footprint so nothing moves when the icon arrives
+    img.set_size_request(size, size)
+    img.texture_key = None
+    img.wanted_key = None
+    img.connect("destroy", _on_image_destroy)
+    return img
+
+
+def texture_image(path: str, size: int, fallback_icon: str) -> Gtk.Image:
+    """Create an image that shows ``path`` at ``size`` logical pixels.
+
+    The image starts as an empty placeholder and is filled in once the file
+    is decoded, or with the theme icon ``fallback_icon`` when it cannot be.
+    The texture follows the widget's scale factor; when it changes, the
+    image is re-rasterized and the texture for the old scale is dropped if
+    nothing else uses it.
+    """
+    img = _placeholder(size)
+    img.connect("notify::scale-factor", _on_file_scale_changed)
+    set_image_source(img, path, size, fallback_icon)
+    return img
+
+
+def set_image_source(img: Gtk.Image, path: str, size: int, fallback_icon: str) -> None:
+    """Point an image made by ``texture_image`` at another file.
+
+    Used when a recycled list cell is bound to a new item. The old texture
+    is only released, so it stays cached until the LRU evicts it and
+    scrolling back to it does not decode it again.
+    """
+    scale = img.get_scale_factor() if img.get_realized() else display_scale()
+    key = (path, size, scale)
+    if key == img.wanted_key:
+        return
+    img.source = (path, size, fallback_icon)
+    img.set_pixel_size(size)
+    img.set_size_request(size, size)
+    if img.texture_key is not None:
+        TEXTURES.release(img.texture_key)
+        img.texture_key = None
+    # Also drops a theme fallback, so the previous item's icon never lingers
+    img.clear()
+    _load_file(img, key, fallback_icon)
+
+
+def theme_image(name: str, size: int) -> Gtk.Image:
+    """Create an image that shows the theme icon ``name``."""
+    img = _placeholder(size)
+    img.connect("notify::scale-factor", _on_theme_scale_changed, name, size)
+    _load_theme(img, name, size, display_scale())
+    return img
+
+
+def _load_file(img: Gtk.Image, key: TextureKey, fallback_icon: str) -> None:
+    img.wanted_key = key
+    texture = TEXTURES.lookup(key)
+    if texture is not None:
+        _show_texture(img, key, texture)
+        return
+
+    def on_decoded(texture: Gdk.Texture | None) -> None:
+        if img.wanted_key != key:
+            return
+        if texture is None:
+            _load_theme(img, fallback_icon, key[1], key[2])
+        else:
+            _show_texture(img, key, texture)
+
+    LOADER.request_file(key, on_decoded)
+
+
+def _load_theme(img: Gtk.Image, name: str, size: int, scale: int) -> None:
+    key = (name, size, scale)
+    img.wanted_key = key
+
+    def on_found(paintable: Gdk.Paintable) -> None:
+        if img.wanted_key == key:
+            _forget_texture(img)
+            img.set_from_paintable(paintable)
+
+    LOADER.request_theme(name, size, scale, on_found)
+
+
+def _show_texture(img: Gtk.Image, key: TextureKey, texture: Gdk.Texture) -> None:
+    img.set_from_paintable(texture)
+    TEXTURES.acquire(key)
+    _forget_texture(img)
+    img.texture_key = key
+
+
+def _forget_texture(img: Gtk.Image) -> None:
+    """Release the texture the image showed so far."""
+    if img.texture_key is not None:
+        TEXTURES.release(img.texture_key)
+        TEXTURES.invalidate(img.texture_key)
+        img.texture_key = None
+
+
+def _on_file_scale_changed(img: Gtk.Image, _pspec) -> None:
+    path, size, fallback_icon = img.source
+    key = (path, size, img.get_scale_factor())
+    if key != img.wanted_key:
+        _load_file(img, key, fallback_icon)
+
+
+def _on_theme_scale_changed(img: Gtk.Image, _pspec, name: str, size: int) -> None:
+    scale = img.get_scale_factor()
+    if (name, size, scale) != img.wanted_key:
+        _load_theme(img, name, size, scale)
+
+
+def _on_image_destroy(img: Gtk.Image) -> None:
+    if img.texture_key is not None:
+        TEXTURES.release(img.texture_key)
+        img.texture_key = None
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""Entry point of BigLinux Welcome.
+
+Python keeps no bytecode for the script it runs, so this one stays tiny:
+logins that should not show the window end in ``autostart.handle`` before
+main.py and GTK are imported, and main.py is loaded from its cached
+bytecode like any other module.
+"""
+
+import sys
+
+import autostart
+
+autostart.handle(sys.argv)
+
+import main  # noqa: E402
+
+main.main()
@@ -0,0 +1,50 @@
+"""XDG base directory helpers (standard library only)."""
+
+from __future__ import annotations
+
+import os
+
+
+def data_home() -> str:
+    return os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+
+
+def config_home() -> str:
+    return os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+
+
+def cache_home() -> str:
+    return os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+
+def data_dirs() -> list[str]:
+    value = os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share"
+    return [d for d in value.split(":") if d]
+
+
+def config_dirs() -> list[str]:
+    value = os.environ.get("XDG_CONFIG_DIRS") or "/etc/xdg"
+    return [d for d in value.split(":") if d]
+
+
+def current_desktops() -> list[str]:
+    """Lower-cased entries of XDG_CURRENT_DESKTOP, e.g. ``["kde"]``."""
+    return [d.lower() for d in os.environ.get("XDG_CURRENT_DESKTOP", "").split(":") if d]
+
+
+def application_dirs() -> list[str]:
+    """Directories searched for ``.desktop`` files, in XDG order."""
+    roots = [data_home()] + data_dirs()
+    # Flatpak exports are normally in XDG_DATA_DIRS already; make sure of it
+    roots += [
+        os.path.join(data_home(), "flatpak", "exports", "share"),
+        "/var/lib/flatpak/exports/share",
+    ]
+    return list(dict.fromkeys(os.path.join(root, "applications") for root in roots))
+
+
+def mimeapps_dirs() -> list[str]:
+    """Directories that may hold a mimeapps.list, in XDG precedence order."""
+    dirs = [config_home()] + config_dirs()
+    dirs += [os.path.join(d, "applications") for d in [data_home()] + data_dirs()]
+    return list(dict.fromkeys(dirs))